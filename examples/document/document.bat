@@ -0,0 +1,20 @@
+@echo off
+
+rem The following variables shall be adapted:
+set USERNAME="my_username"
+set PASSWORD="my_password"
+set SERVER="https://my-polarion-instance.com"
+set PROJECT="MYPROJECT"
+set DOCUMENT="Specification/System Requirements"
+
+echo Please set the variables inside this file.
+echo:
+
+rem Define and execute the command
+set command=pyPolarionCli --verbose --user %USERNAME% --password %PASSWORD% --server %SERVER% document --project %PROJECT% --document %DOCUMENT%
+
+echo Executing....
+echo %command%
+echo:
+%command%
+pause
\ No newline at end of file
@@ -0,0 +1,20 @@
+@echo off
+
+rem The following variables shall be adapted:
+set USERNAME="my_username"
+set PASSWORD="my_password"
+set SERVER="https://my-polarion-instance.com"
+set CONFIG="metrics.toml"
+set DATABASE="metrics.db"
+
+echo Please set the variables inside this file and the metrics inside %CONFIG%.
+echo:
+
+rem Define and execute the command
+set command=pyPolarionCli --verbose --user %USERNAME% --password %PASSWORD% --server %SERVER% snapshot --config %CONFIG% --database %DATABASE%
+
+echo Executing....
+echo %command%
+echo:
+%command%
+pause
\ No newline at end of file
@@ -0,0 +1,19 @@
+@echo off
+
+rem The following variables shall be adapted:
+set METRIC="open_defects"
+set DATABASE="metrics.db"
+set FROM="2025-01-01"
+set TO="2025-12-31"
+
+echo Please set the variables inside this file.
+echo:
+
+rem Define and execute the command
+set command=pyPolarionCli --verbose trend --metric %METRIC% --database %DATABASE% --from %FROM% --to %TO%
+
+echo Executing....
+echo %command%
+echo:
+%command%
+pause
\ No newline at end of file
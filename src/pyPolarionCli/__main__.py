@@ -36,11 +36,17 @@
 import sys
 import argparse
 import logging
+from typing import Optional
 from polarion.polarion import Polarion
 
 from pyPolarionCli.version import __version__, __author__, __email__, __repository__, __license__
 from pyPolarionCli.ret import Ret
 from pyPolarionCli.cmd_search import register as cmd_search_register
+from pyPolarionCli.cmd_history import register as cmd_history_register
+from pyPolarionCli.cmd_snapshot import register as cmd_snapshot_register
+from pyPolarionCli.cmd_trend import register as cmd_trend_register
+from pyPolarionCli.cmd_testruns import register as cmd_testruns_register
+from pyPolarionCli.cmd_document import register as cmd_document_register
 
 
 ################################################################################
@@ -49,7 +55,12 @@ from pyPolarionCli.cmd_search import register as cmd_search_register
 
 # Register a command here!
 _COMMAND_REG_LIST = [
-    cmd_search_register
+    cmd_search_register,
+    cmd_history_register,
+    cmd_snapshot_register,
+    cmd_trend_register,
+    cmd_testruns_register,
+    cmd_document_register
 ]
 
 PROG_NAME = "pyPolarionCli"
@@ -84,36 +95,39 @@ def add_parser() -> argparse.ArgumentParser:
                                      description=PROG_DESC,
                                      epilog=PROG_EPILOG)
 
-    required_arguments = parser.add_argument_group('required arguments')
-
-    required_arguments.add_argument('-u',
-                                    '--user',
-                                    type=str,
-                                    metavar='<user>',
-                                    required=True,
-                                    help="The user to authenticate with the Polarion server.")
-
-    required_arguments.add_argument('-p',
-                                    '--password',
-                                    type=str,
-                                    metavar='<password>',
-                                    required=False,
-                                    help="The password to authenticate with the Polarion server.\
-                                    Is ignored if a token is defined using -t option.")
-
-    required_arguments.add_argument('-t',
-                                    '--token',
-                                    type=str,
-                                    metavar='<token>',
-                                    required=False,
-                                    help="The token to authenticate with the Polarion server.")
-
-    required_arguments.add_argument('-s',
-                                    '--server',
-                                    type=str,
-                                    metavar='<server_url>',
-                                    required=True,
-                                    help="The Polarion server URL to connect to.")
+    login_arguments = parser.add_argument_group(
+        'login arguments',
+        'User, server and either password or token are required by all commands ' +
+        'which access the Polarion server.')
+
+    login_arguments.add_argument('-u',
+                                '--user',
+                                type=str,
+                                metavar='<user>',
+                                required=False,
+                                help="The user to authenticate with the Polarion server.")
+
+    login_arguments.add_argument('-p',
+                                '--password',
+                                type=str,
+                                metavar='<password>',
+                                required=False,
+                                help="The password to authenticate with the Polarion server.\
+                                Is ignored if a token is defined using -t option.")
+
+    login_arguments.add_argument('-t',
+                                '--token',
+                                type=str,
+                                metavar='<token>',
+                                required=False,
+                                help="The token to authenticate with the Polarion server.")
+
+    login_arguments.add_argument('-s',
+                                '--server',
+                                type=str,
+                                metavar='<server_url>',
+                                required=False,
+                                help="The Polarion server URL to connect to.")
 
     parser.add_argument("--version",
                         action="version",
@@ -128,6 +142,79 @@ def add_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _find_command(commands: list[dict], name: str) -> Optional[dict]:
+    """ Find a registered command by its name.
+
+    Args:
+        commands (list[dict]): The registered commands.
+        name (str): The name of the command.
+
+    Returns:
+        dict: The command, None if not found.
+    """
+    found_command = None
+
+    for command in commands:
+        if command["name"] == name:
+            found_command = command
+            break
+
+    return found_command
+
+
+def _check_login_arguments(parser: argparse.ArgumentParser, args) -> Ret:
+    """ Check the login arguments of a command which accesses the Polarion server.
+        Missing user or server are reported like missing required arguments by argparse.
+
+    Args:
+        parser (obj): The parser object for commandline arguments.
+        args (obj): The command line arguments.
+
+    Returns:
+        Ret: The status of the check.
+    """
+    ret_status = Ret.OK
+
+    missing = [option for option, value in [("-u/--user", args.user), ("-s/--server", args.server)]
+               if value is None]
+
+    if 0 < len(missing):
+        # Exits the program with the argparse error code.
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+    elif (args.password is None) and (args.token is None):
+        ret_status = Ret.ERROR_INVALID_ARGUMENTS
+        LOG.error("Missing password or token!")
+
+    return ret_status
+
+
+def _login(args) -> tuple[Ret, Optional[Polarion]]:
+    """ Create a Polarion client which communicates to the Polarion server.
+
+    Args:
+        args (obj): The command line arguments.
+
+    Returns:
+        tuple[Ret, Polarion]: The status of the login and the client, None if the login failed.
+    """
+    ret_status = Ret.OK
+    client = None
+
+    # A broad exception has to be caught since the specific Exception Type can't be accessed.
+    try:
+        client = Polarion(polarion_url=args.server,
+                          user=args.user,
+                          password=args.password,
+                          token=args.token,
+                          verify_certificate=False,
+                          static_service_list=True)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        LOG.error(e)
+        ret_status = Ret.ERROR_LOGIN
+
+    return ret_status, client
+
+
 def main() -> Ret:
     """ The program entry point function.
 
@@ -136,6 +223,7 @@ def main() -> Ret:
     """
     ret_status = Ret.OK
     commands = []
+    command = None
 
     # Create the main parser and add the subparsers.
     parser = add_parser()
@@ -153,10 +241,20 @@ def main() -> Ret:
     if args is None:
         ret_status = Ret.ERROR_ARGPARSE
         parser.print_help()
-    elif (args.password is None) and (args.token is None):
-        ret_status = Ret.ERROR_INVALID_ARGUMENTS
-        LOG.error("Missing password or token!")
     else:
+        command = _find_command(commands, args.cmd)
+
+        if command is None:
+            LOG.error("Command '%s' not found!", args.cmd)
+            ret_status = Ret.ERROR_INVALID_ARGUMENTS
+
+        # Commands which only work on local data don't need a login.
+        elif command.get("client", True):
+            ret_status = _check_login_arguments(parser, args)
+
+    if Ret.OK == ret_status:
+        client = None
+
         # If the verbose flag is set, change the default logging level.
         if args.verbose:
             logging.basicConfig(level=logging.INFO)
@@ -164,34 +262,12 @@ def main() -> Ret:
             for arg in vars(args):
                 LOG.info("* %s = %s", arg, vars(args)[arg])
 
-        # Create a Polarion client which communicates to the Polarion server.
-        # A broad exception has to be caught since the specific Exception Type can't be accessed.
-        try:
-            client = Polarion(polarion_url=args.server,
-                              user=args.user,
-                              password=args.password,
-                              token=args.token,
-                              verify_certificate=False,
-                              static_service_list=True)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            LOG.error(e)
-            ret_status = Ret.ERROR_LOGIN
+        if command.get("client", True):
+            ret_status, client = _login(args)
 
+        # Execute the command.
         if Ret.OK == ret_status:
-            handler = None
-
-            # Find the command handler.
-            for command in commands:
-                if command["name"] == args.cmd:
-                    handler = command["handler"]
-                    break
-
-            # Execute the command.
-            if handler is not None:
-                ret_status = handler(args, client)
-            else:
-                LOG.error("Command '%s' not found!", args.cmd)
-                ret_status = Ret.ERROR_INVALID_ARGUMENTS
+            ret_status = command["handler"](args, client)
 
     return ret_status
 
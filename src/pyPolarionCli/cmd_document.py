@@ -0,0 +1,398 @@
+"""Document command module of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import argparse
+import logging
+import os
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from polarion.polarion import Polarion
+from polarion.project import Project
+from polarion.document import Document
+from pyPolarionCli.ret import Ret
+from pyPolarionCli.serializer import parse_nested_search_results
+from pyPolarionCli.common import add_project_argument, add_output_argument, \
+    add_jobs_argument, get_output_folder
+
+################################################################################
+# Variables
+################################################################################
+
+LOG: logging.Logger = logging.getLogger(__name__)
+_CMD_NAME = "document"
+_OUTPUT_FILE_NAME = "documents.json"
+_REQUIRED_FIELDS = ["id", "title", "type", "outlineNumber"]
+_DEFAULT_FIELDS = _REQUIRED_FIELDS + ["status"]
+_HEADING_TYPE = "heading"
+_DEFAULT_JOBS = 4
+_DEFAULT_BATCH_SIZE = 100
+
+################################################################################
+# Classes
+################################################################################
+
+
+class _DocumentReader:
+    """Reads documents and fetches their work items in parallel batches.
+    The work items are kept, so work items referenced by several documents are fetched only once.
+    """
+
+    def __init__(self,
+                 service: object,
+                 executor: ThreadPoolExecutor,
+                 fields: list[str],
+                 batch_size: int) -> None:
+        """
+        Args:
+            service (obj): The Tracker service of the Polarion client.
+            executor (obj): The executor to fetch the batches with.
+            fields (list[str]): The fields to fetch.
+            batch_size (int): The number of work items per request.
+        """
+        self._service = service
+        self._executor = executor
+        self._fields = fields
+        self._batch_size = batch_size
+        self.workitems: dict = {}
+
+    def fetch(self, workitem_uris: list[str]) -> dict:
+        """
+        Fetch the work items which are not in the cache yet.
+
+        Args:
+            workitem_uris (list[str]): The URIs of the work items.
+
+        Returns:
+            dict: The parsed work items which are fetched so far, with the URI as key.
+        """
+        missing_uris = list(dict.fromkeys(
+            uri for uri in workitem_uris if uri not in self.workitems))
+
+        futures = [self._executor.submit(_get_workitems,
+                                         self._service,
+                                         missing_uris[index:index + self._batch_size],
+                                         self._fields)
+                   for index in range(0, len(missing_uris), self._batch_size)]
+
+        for future in futures:
+            self.workitems.update(future.result())
+
+        LOG.info("%d of %d work items fetched, %d taken from the cache.",
+                 len(missing_uris), len(workitem_uris), len(workitem_uris) - len(missing_uris))
+
+        return self.workitems
+
+    def get_document(self, project: Project, location: str) -> dict:
+        """
+        Get a document with its work items in structural order.
+
+        Args:
+            project (obj): The project which contains the document.
+            location (str): The location of the document, e.g. <space>/<document>.
+
+        Returns:
+            dict: The document.
+        """
+        document: Document = project.getDocument(location)
+        workitem_uris: list[str] = document.getWorkitemUris()
+        results: list[dict] = _get_structured_workitems(workitem_uris, self.fetch(workitem_uris))
+
+        return {
+            "location": location,
+            "title": getattr(document, "title", None),
+            "number_of_results": len(results),
+            "results": results
+        }
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _split_workitem_uri(workitem_uri: str) -> tuple[str, str]:
+    """
+    Split a work item URI into project ID and work item ID.
+    Example: subterra:data-service:objects:/default/MYPROJECT${WorkItem}MYPROJECT-123
+
+    Args:
+        workitem_uri (str): The URI of the work item.
+
+    Returns:
+        tuple[str, str]: The project ID and the work item ID.
+    """
+    project_part, workitem_id = workitem_uri.split("}", 1)
+    project_id = project_part.split("/")[-1].split("$")[0]
+
+    return project_id, workitem_id
+
+
+def _get_workitems(service: object,
+                   workitem_uris: list[str],
+                   fields: list[str]) -> dict:
+    """
+    Get a batch of work items with a single query per project.
+    Documents may reference work items of other projects.
+
+    Args:
+        service (obj): The Tracker service of the Polarion client.
+        workitem_uris (list[str]): The URIs of the work items.
+        fields (list[str]): The fields to fetch.
+
+    Returns:
+        dict: The parsed work items, with the URI as key.
+    """
+    ids_per_project: dict = {}
+    workitems: dict = {}
+
+    for workitem_uri in workitem_uris:
+        project_id, workitem_id = _split_workitem_uri(workitem_uri)
+        ids_per_project.setdefault(project_id, []).append(workitem_id)
+
+    for project_id, workitem_ids in ids_per_project.items():
+        search_result = service.queryWorkItemsLimited(
+            f"project.id:{project_id} AND id:({' '.join(workitem_ids)})", "id", fields, -1)
+
+        for workitem, workitem_dict in zip(search_result,
+                                           parse_nested_search_results(search_result)):
+            workitems[workitem.uri] = workitem_dict
+
+    return workitems
+
+
+def _get_fields(additional_fields: Optional[list[str]]) -> list[str]:
+    """
+    Get the fields to fetch for the work items, i.e. the default fields
+    and the additional fields given by the command line arguments.
+
+    Args:
+        additional_fields (list[str]): The additional fields, None if not given.
+
+    Returns:
+        list[str]: The fields without duplicates.
+    """
+    fields: list[str] = list(_DEFAULT_FIELDS)
+
+    if additional_fields is not None:
+        fields = list(dict.fromkeys(fields + additional_fields))
+
+    return fields
+
+
+def _get_outline_key(outline_number: object) -> tuple:
+    """
+    Get the sort key of an outline number, e.g. "1.2" for a heading or "1.2-3"
+    for the third work item below this heading. The work items below a heading
+    are placed before its sub headings, outline numbers which can't be parsed last.
+
+    Args:
+        outline_number (obj): The outline number of the work item.
+
+    Returns:
+        tuple: The sort key.
+    """
+    heading_part, _, item_part = str(outline_number).partition("-")
+    key: tuple = (1,)
+
+    try:
+        parts = [(1, int(part)) for part in heading_part.split(".")]
+
+        if "" != item_part:
+            parts.append((0, int(item_part)))
+
+        key = (0, tuple(parts))
+
+    except ValueError:
+        pass
+
+    return key
+
+
+def _get_structured_workitems(workitem_uris: list[str], cache: dict) -> list[dict]:
+    """
+    Get the work items of a document in structural order, which is given by their outline numbers.
+    Every work item gets the titles of its enclosing headings and headings
+    additionally get their level, derived from the outline number.
+
+    Args:
+        workitem_uris (list[str]): The URIs of the work items of the document.
+        cache (dict): The parsed work items, with the URI as key.
+
+    Returns:
+        list[dict]: The work items in structural order.
+    """
+    results: list[dict] = []
+    headings: list[str] = []
+
+    for workitem_uri in workitem_uris:
+        if workitem_uri not in cache:
+            # This happens when a reference to a deleted work item is not removed from a document.
+            LOG.warning("Work item %s not found.", workitem_uri)
+        else:
+            results.append(dict(cache[workitem_uri]))
+
+    results.sort(key=lambda workitem_dict: _get_outline_key(workitem_dict.get("outlineNumber")))
+
+    for workitem_dict in results:
+        workitem_type = workitem_dict.get("type")
+
+        if isinstance(workitem_type, dict) and (_HEADING_TYPE == workitem_type.get("id")):
+            level = len(str(workitem_dict.get("outlineNumber", "")).split("."))
+            headings = headings[:level - 1]
+            workitem_dict["level"] = level
+            workitem_dict["headings"] = list(headings)
+            headings.append(workitem_dict.get("title", ""))
+        else:
+            workitem_dict["headings"] = list(headings)
+
+    return results
+
+
+def register(subparser) -> dict:
+    """ Register subparser commands for the document module.
+
+    Args:
+        subparser (obj):   the command subparser provided via __main__.py
+
+    Returns:
+        obj:    the command parser of this module
+    """
+    cmd_dict: dict = {
+        "name": _CMD_NAME,
+        "handler": _execute
+    }
+
+    sub_parser_document: argparse.ArgumentParser = \
+        subparser.add_parser(_CMD_NAME,
+                             help="Export Polarion documents with their work items " +
+                             "in structural order.")
+    required_subarguments = sub_parser_document.add_argument_group(
+        'required arguments')
+
+    add_project_argument(required_subarguments,
+                         "The ID of the Polarion project which contains the documents.")
+
+    required_subarguments.add_argument('-d',
+                                       '--document',
+                                       type=str,
+                                       action="append",
+                                       metavar='<location>',
+                                       required=True,
+                                       help="The location of the document, " +
+                                       "e.g. <space>/<document>. " +
+                                       "Can be used multiple times to export multiple documents.")
+
+    add_output_argument(sub_parser_document, "The path to output folder to store the documents.")
+
+    sub_parser_document.add_argument("--field",
+                                     type=str,
+                                     action="append",
+                                     metavar="<field>",
+                                     required=False,
+                                     help="An additional field to fetch for the work items. " +
+                                     "Can be used multiple times to fetch multiple fields.")
+
+    add_jobs_argument(sub_parser_document, _DEFAULT_JOBS,
+                      "The number of batches to fetch concurrently.")
+
+    sub_parser_document.add_argument("--batch-size",
+                                     type=int,
+                                     metavar="<batch_size>",
+                                     default=_DEFAULT_BATCH_SIZE,
+                                     required=False,
+                                     help="The number of work items to fetch with one request. " +
+                                     f"Default: {_DEFAULT_BATCH_SIZE}.")
+
+    return cmd_dict
+
+
+def _execute(args, polarion_client: Polarion) -> Ret:
+    """ This function serves as entry point for the command 'document'.
+        It will be stored as callback for this module's subparser command.
+
+    Args:
+        args (obj): The command line arguments.
+        polarion_client (obj): The Polarion client object.
+
+    Returns:
+        bool: The status of the command execution.
+    """
+    ret_status: Ret = Ret.ERROR_INVALID_ARGUMENTS
+
+    if ("" != args.project) and (0 < args.jobs) and (0 < args.batch_size) and \
+            (None is not polarion_client):
+        file_path: str = os.path.join(get_output_folder(args.output),
+                                      f"{args.project}_{_OUTPUT_FILE_NAME}")
+
+        try:
+            # Get the project object from the Polarion client.
+            project: Project = polarion_client.getProject(args.project)
+
+            with open(file_path, 'w', encoding="UTF-8") as file, \
+                    ThreadPoolExecutor(max_workers=args.jobs) as executor:
+                # The fetched work items are shared by all documents. Each getService() call
+                # checks the session with an additional request, therefore the service
+                # is fetched once and shared by all jobs.
+                reader = _DocumentReader(polarion_client.getService('Tracker'), executor,
+                                         _get_fields(args.field), args.batch_size)
+
+                file.write("{\n")
+                file.write(f'  "project": {json.dumps(args.project)},\n')
+                file.write('  "documents": [')
+
+                # Each document is written as soon as its work items are available.
+                for index, location in enumerate(args.document):
+                    document_dict: dict = reader.get_document(project, location)
+
+                    separator = "\n" if 0 == index else ",\n"
+                    file.write(separator +
+                               textwrap.indent(json.dumps(document_dict, indent=2), "    "))
+
+                file.write("\n  ]\n}\n")
+
+            LOG.info("%d documents stored in %s", len(args.document), file_path)
+            ret_status = Ret.OK
+
+        # Exception of type Exception is raised when the project or document does not exist.
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.error("%s", ex)
+            ret_status = Ret.ERROR_DOCUMENT_FAILED
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
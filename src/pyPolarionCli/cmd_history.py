@@ -0,0 +1,334 @@
+"""History command module of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import csv
+import json
+import argparse
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from polarion.polarion import Polarion
+from polarion.project import Project
+from pyPolarionCli.ret import Ret
+from pyPolarionCli.common import add_project_argument, add_query_argument, add_output_argument, \
+    add_jobs_argument, get_output_folder
+from pyPolarionCli.workitem_fields import get_field_value
+
+################################################################################
+# Variables
+################################################################################
+
+LOG: logging.Logger = logging.getLogger(__name__)
+_CMD_NAME = "history"
+_OUTPUT_FILE_NAME = "history.csv"
+_CACHE_FOLDER_NAME = "history_cache"
+_DEFAULT_FIELDS = ["status"]
+_DEFAULT_JOBS = 4
+_CSV_HEADER = ["id", "revision", "updated", "field", "old_value", "new_value"]
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_cache_file_path(cache_folder: str, workitem_id: str) -> str:
+    """
+    Get the path of the revision cache file of a work item.
+
+    Args:
+        cache_folder (str): The folder which contains the revision cache.
+        workitem_id (str): The ID of the work item.
+
+    Returns:
+        str: The path to the cache file.
+    """
+    return os.path.join(cache_folder, f"{workitem_id}.json")
+
+
+def _load_cache(file_path: str) -> dict:
+    """
+    Load the cached revisions of a work item.
+
+    Args:
+        file_path (str): The path to the cache file.
+
+    Returns:
+        dict: The cached revisions, with the revision as key.
+    """
+    revisions: dict = {}
+
+    if os.path.isfile(file_path):
+        try:
+            with open(file_path, 'r', encoding="UTF-8") as file:
+                revisions = json.load(file)["revisions"]
+
+        except (OSError, ValueError, KeyError) as ex:
+            LOG.warning("Ignoring invalid cache file %s: %s", file_path, ex)
+            revisions = {}
+
+    return revisions
+
+
+def _store_cache(file_path: str, revisions: dict) -> None:
+    """
+    Store the revisions of a work item in the cache.
+
+    Args:
+        file_path (str): The path to the cache file.
+        revisions (dict): The revisions, with the revision as key.
+
+    Returns:
+        None
+    """
+    with open(file_path, 'w', encoding="UTF-8") as file:
+        file.write(json.dumps({"revisions": revisions}))
+
+
+def _get_workitem_revisions(service: object,
+                            workitem: object,
+                            fields: list[str],
+                            cache_folder: str) -> list[dict]:
+    """
+    Get all revisions of a work item. Past revisions never change, therefore only the
+    revisions and fields which are not in the cache yet are fetched from the server.
+    The cache keeps the fields of all previous runs.
+
+    Args:
+        service (obj): The Tracker service of the Polarion client.
+        workitem (obj): The work item search result with its ID and URI.
+        fields (list[str]): The fields to track.
+        cache_folder (str): The folder which contains the revision cache.
+
+    Returns:
+        list[dict]: The revisions of the work item in chronological order.
+    """
+    file_path = _get_cache_file_path(cache_folder, workitem.id)
+    cached_revisions = _load_cache(file_path)
+    revisions: dict = {}
+    is_cache_outdated = False
+
+    for revision in service.getRevisions(workitem.uri):
+        revision_dict = cached_revisions.get(revision, {"updated": "", "fields": {}})
+        missing_fields = [field for field in fields if field not in revision_dict["fields"]]
+
+        if 0 < len(missing_fields):
+            workitem_in_revision = service.getWorkItemByUriInRevision(
+                workitem.uri, revision, missing_fields + ["updated"])
+
+            revision_dict["updated"] = get_field_value(workitem_in_revision, "updated")
+            revision_dict["fields"].update(
+                {field: get_field_value(workitem_in_revision, field) for field in missing_fields})
+            is_cache_outdated = True
+
+        revisions[revision] = revision_dict
+
+    if is_cache_outdated is True:
+        _store_cache(file_path, revisions)
+
+    return [{"revision": revision, **revision_dict}
+            for revision, revision_dict in revisions.items()]
+
+
+def _get_field_changes(workitem_id: str,
+                       revisions: list[dict],
+                       fields: list[str]) -> list[list[str]]:
+    """
+    Get one row per field change from the revisions of a work item.
+    The first revision reports the initial value of each field.
+
+    Args:
+        workitem_id (str): The ID of the work item.
+        revisions (list[dict]): The revisions of the work item in chronological order.
+        fields (list[str]): The fields to track.
+
+    Returns:
+        list[list[str]]: The rows, in the order of the CSV header.
+    """
+    rows: list[list[str]] = []
+    previous_values: dict = {}
+
+    for revision in revisions:
+        for field in fields:
+            new_value = revision["fields"][field]
+
+            if (field not in previous_values) or (previous_values[field] != new_value):
+                rows.append([workitem_id,
+                             revision["revision"],
+                             revision["updated"],
+                             field,
+                             previous_values.get(field, ""),
+                             new_value])
+                previous_values[field] = new_value
+
+    return rows
+
+
+def _write_history(file_path: str, search_result: list, futures: list, fields: list[str]) -> None:
+    """
+    Store the field changes in a CSV file, in the order of the search results.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        search_result (list): The work item search results.
+        futures (list): The futures which provide the revisions of each work item.
+        fields (list[str]): The fields to track.
+
+    Returns:
+        None
+    """
+    with open(file_path, 'w', encoding="UTF-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(_CSV_HEADER)
+
+        for workitem, future in zip(search_result, futures):
+            writer.writerows(_get_field_changes(
+                workitem.id, future.result(), fields))
+
+
+def register(subparser) -> dict:
+    """ Register subparser commands for the history module.
+
+    Args:
+        subparser (obj):   the command subparser provided via __main__.py
+
+    Returns:
+        obj:    the command parser of this module
+    """
+    cmd_dict: dict = {
+        "name": _CMD_NAME,
+        "handler": _execute
+    }
+
+    sub_parser_history: argparse.ArgumentParser = \
+        subparser.add_parser(_CMD_NAME,
+                             help="Export the field changes of Polarion work items.")
+    required_subarguments = sub_parser_history.add_argument_group(
+        'required arguments')
+
+    add_project_argument(required_subarguments, "The ID of the Polarion project to search in.")
+    add_query_argument(required_subarguments, "The query string to search for work items.")
+
+    add_output_argument(sub_parser_history, "The path to output folder to store the history.")
+
+    sub_parser_history.add_argument("--field",
+                                    type=str,
+                                    action="append",
+                                    metavar="<field>",
+                                    required=False,
+                                    help="The field to track in the work items. Default: status. " +
+                                    "Can be used multiple times to track multiple fields.")
+
+    sub_parser_history.add_argument("--cache",
+                                    type=str,
+                                    metavar="<cache_folder>",
+                                    required=False,
+                                    help="The path to the folder to cache the fetched revisions. " +
+                                    f"Default: {_CACHE_FOLDER_NAME} in the output folder.")
+
+    add_jobs_argument(sub_parser_history, _DEFAULT_JOBS,
+                      "The number of work items to fetch concurrently.")
+
+    return cmd_dict
+
+
+def _execute(args, polarion_client: Polarion) -> Ret:
+    """ This function serves as entry point for the command 'history'.
+        It will be stored as callback for this module's subparser command.
+
+    Args:
+        args (obj): The command line arguments.
+        polarion_client (obj): The Polarion client object.
+
+    Returns:
+        bool: The status of the command execution.
+    """
+    ret_status: Ret = Ret.ERROR_INVALID_ARGUMENTS
+
+    if ("" != args.project) and ("" != args.query) and (0 < args.jobs) and \
+            (None is not polarion_client):
+        fields: list[str] = _DEFAULT_FIELDS
+
+        if args.field is not None:
+            fields = args.field
+
+        output_folder: str = get_output_folder(args.output)
+        file_path: str = os.path.join(
+            output_folder, f"{args.project}_{_OUTPUT_FILE_NAME}")
+
+        cache_folder: str = os.path.join(output_folder, _CACHE_FOLDER_NAME, args.project)
+        if args.cache is not None:
+            cache_folder = os.path.join(args.cache, args.project)
+        os.makedirs(cache_folder, exist_ok=True)
+
+        try:
+            # Get the project object from the Polarion client.
+            project: Project = polarion_client.getProject(args.project)
+
+            # Only the ID and URI are required to fetch the revisions.
+            search_result: list = project.searchWorkitem(
+                args.query, field_list=["id", "uri"])
+
+            # Each getService() call checks the session with an additional request,
+            # therefore the service is fetched once and shared by all jobs.
+            service = polarion_client.getService('Tracker')
+
+            with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+                futures = [executor.submit(_get_workitem_revisions,
+                                           service,
+                                           workitem,
+                                           fields,
+                                           cache_folder)
+                           for workitem in search_result]
+
+                _write_history(file_path, search_result, futures, fields)
+
+            LOG.info("History of %d work items stored in %s",
+                     len(search_result), file_path)
+            ret_status = Ret.OK
+
+        # Exception of type Exception is raised when the project does not exist.
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.error("%s", ex)
+            ret_status = Ret.ERROR_HISTORY_FAILED
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
@@ -37,11 +37,18 @@ import json
 import argparse
 import logging
 import os
-from datetime import date, datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from polarion.polarion import Polarion
 from polarion.project import Project
 from polarion.workitem import Workitem
 from pyPolarionCli.ret import Ret
+from pyPolarionCli.common import add_project_argument, add_query_argument, add_output_argument, \
+    add_jobs_argument, get_output_folder
+from pyPolarionCli.serializer import parse_nested_search_results
+from pyPolarionCli.search_planner import SearchPlanner, STRATEGY_DEFAULT, STRATEGY_PROJECTION, \
+    STRATEGY_FULL, STRATEGY_CONCURRENT
 
 ################################################################################
 # Variables
@@ -50,6 +57,8 @@ from pyPolarionCli.ret import Ret
 LOG: logging.Logger = logging.getLogger(__name__)
 _CMD_NAME = "search"
 _OUTPUT_FILE_NAME = "search_results.json"
+_COST_FILE_NAME = "search_costs.json"
+_DEFAULT_JOBS = 4
 
 ################################################################################
 # Classes
@@ -60,108 +69,160 @@ _OUTPUT_FILE_NAME = "search_results.json"
 ################################################################################
 
 
-def _handle_object_with_dict(obj_with_dict: object) -> dict:
+def _get_requested_strategy(args) -> str:
     """
-    Handle an object with a __dict__ attribute.
+    Get the strategy which provides the fields requested by the command line arguments.
 
     Args:
-        obj_with_dict (obj): The object to handle.
+        args (obj): The command line arguments.
 
     Returns:
-        dict: The dictionary representation of the object.
+        str: The requested strategy.
     """
-    parsed_dict: dict = {}
-    for _, subvalue in obj_with_dict.__dict__.items():
-        for subkey in subvalue:
-            _parse_attributes_recursively(
-                parsed_dict,
-                subvalue[subkey],
-                subkey)
-    return parsed_dict
+    requested = STRATEGY_DEFAULT
+
+    if args.full is True:
+        requested = STRATEGY_FULL
+    elif args.field is not None:
+        requested = STRATEGY_PROJECTION
 
+    return requested
 
-def _parse_attributes_recursively(output_dict: dict, value: object, key: str) -> None:
+
+def _search(project: Project, args, strategy: str, id_result: Optional[list]) -> list[dict]:
     """
-    Parse the attributes of Python objects recursively and store them in a dictionary.
+    Search for work items in the project with the given strategy.
 
     Args:
-        output_dict (dict): The dictionary to store the parsed attributes.
-        value (obj): The value to parse.
-        key (str): The key of the value in the dictionary.
+        project (obj): The project object to search in.
+        args (obj): The command line arguments.
+        strategy (str): The search strategy.
+        id_result (list): The result of the search for the work item IDs, if already available.
 
     Returns:
-        None
+        list[dict]: The parsed work items.
     """
-    attribute_value = None
+    results: list[dict] = []
 
-    # Check if the value is a datetime or date object
-    if isinstance(value, (datetime, date)):
-        attribute_value = value.isoformat()
+    if STRATEGY_PROJECTION == strategy:
+        search_result: list[Workitem] = project.searchWorkitem(
+            args.query, field_list=args.field)
 
-    # Check if the value is a list
-    elif isinstance(value, list):
-        sublist: list = []
-        for element in value:
-            # Check if the element is an object with a __dict__ attribute
-            if hasattr(element, "__dict__"):
-                sublist.append(_handle_object_with_dict(element))
+        results = parse_nested_search_results(search_result)
 
-            # Check if the element is a list
-            elif isinstance(element, list):
-                raise RuntimeWarning("List in List")
+    else:
+        if id_result is None:
+            id_result = project.searchWorkitem(args.query)
 
-            # element is a simple value
-            else:
-                sublist.append(element)
+        if STRATEGY_DEFAULT == strategy:
+            for item in id_result:
+                item_dict = vars(item).get("__values__")
+                results.append(item_dict)
+        else:
+            # Fetch every work item with its own request, concurrently if selected.
+            # Project.getWorkitem() calls getService() per work item, which checks the
+            # session with an additional request and may recreate the shared session
+            # without a lock. Therefore the service is fetched once and shared by all jobs.
+            jobs = args.jobs if STRATEGY_CONCURRENT == strategy else 1
+            service = project.polarion.getService('Tracker')
 
-        # Store the list in the attribute value
-        attribute_value = sublist
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                search_result: list = list(executor.map(
+                    lambda workitem_id: service.getWorkItemById(project.id, workitem_id),
+                    [item.id for item in id_result]))
 
-    # Check if the value is an object with a __dict__ attribute
-    elif hasattr(value, "__dict__"):
-        attribute_value = _handle_object_with_dict(value)
+            results = parse_nested_search_results(search_result)
 
-    # value is a simple value
-    else:
-        attribute_value = value
+    return results
 
-    # Store the attribute value in the output dictionary
-    output_dict[key] = attribute_value
 
+def _get_planner(args, output_folder: str) -> Optional[SearchPlanner]:
+    """
+    Get the search planner, if the command line arguments require it. The measured costs
+    are only used with --plan or --auto or if the cost file is given explicitly,
+    so a plain search doesn't access them.
 
-def _parse_nested_search_results(search_result: list[Workitem]) -> list[dict]:
-    """Search for work items in a project and return the full work item objects.
+    Args:
+        args (obj): The command line arguments.
+        output_folder (str): The output folder, which contains the default cost file.
+
+    Returns:
+        obj: The search planner or None, if not required.
+    """
+    planner: Optional[SearchPlanner] = None
+
+    if args.cost_file is not None:
+        planner = SearchPlanner(args.cost_file)
+    elif (args.plan is True) or (args.auto is True):
+        planner = SearchPlanner(os.path.join(output_folder, _COST_FILE_NAME))
+
+    return planner
+
+
+def _plan(planner: SearchPlanner, project: Project, args) -> tuple[str, list, float]:
+    """
+    Estimate the costs of the search strategies with the number of matching work items
+    and print the plan.
 
     Args:
+        planner (obj): The search planner.
         project (obj): The project object to search in.
-        query (str): The query string to search for work items.
+        args (obj): The command line arguments.
 
     Returns:
-        list[Workitem]: The list of work items.
+        tuple[str, list, float]: The selected strategy, the result of the search for the
+            work item IDs and the duration of this search in seconds.
     """
-    output_list: list[dict] = []
+    requested: str = _get_requested_strategy(args)
 
-    # Iterate over the search results and store them in the output dictionary.
-    for workitem in search_result:
-        workitem_dict: dict = {}
+    # The IDs provide the number of results and are reused by the
+    # default and full strategies.
+    start_time = time.perf_counter()
+    id_result: list = project.searchWorkitem(args.query)
+    id_seconds: float = time.perf_counter() - start_time
 
-        # Parse the attributes of the work item recursively.
-        # Internal _polarion_item attribute is used to access the work item attributes.
-        # pylint: disable=protected-access
-        if hasattr(workitem, "_polarion_item"):
-            all_items = workitem._polarion_item.__dict__.items()
-        else:
-            all_items = workitem.__dict__.items()
+    plans = planner.estimate(len(id_result),
+                             0 if args.field is None else len(args.field),
+                             args.jobs)
+
+    if args.auto is True:
+        chosen = planner.choose(plans, requested)
+    else:
+        chosen = next(plan for plan in plans if plan["strategy"] == requested)
 
-        for _, value in all_items:
-            for key in value:
-                _parse_attributes_recursively(
-                    workitem_dict, value[key], key)
+    print(f"Plan for {len(id_result)} work items of query '{args.query}' " +
+          f"in project {args.project}:")
+    print(planner.format_plans(plans, chosen, requested))
 
-        # Append the work item dictionary to the results list.
-        output_list.append(workitem_dict)
+    return chosen["strategy"], id_result, id_seconds
 
-    return output_list
+
+def _measure(planner: SearchPlanner, args, strategy: str, output_dict: dict,
+             measurement: tuple[float, int]) -> None:
+    """
+    Update the costs of the executed strategy to improve later plans and store them.
+
+    Args:
+        planner (obj): The search planner.
+        args (obj): The command line arguments.
+        strategy (str): The executed strategy.
+        output_dict (dict): The search results.
+        measurement (tuple[float, int]): The duration of the search in seconds and
+            the size of the stored results in bytes.
+
+    Returns:
+        None
+    """
+    planner.measure(strategy,
+                    output_dict["number_of_results"],
+                    0 if args.field is None else len(args.field),
+                    seconds=measurement[0],
+                    size=measurement[1],
+                    jobs=args.jobs)
+    try:
+        planner.save()
+    except OSError as ex:
+        LOG.warning("Search costs not stored: %s", ex)
 
 
 def register(subparser) -> dict:
@@ -184,26 +245,10 @@ def register(subparser) -> dict:
     required_subarguments = sub_parser_search.add_argument_group(
         'required arguments')
 
-    required_subarguments.add_argument('-j',
-                                       '--project',
-                                       type=str,
-                                       metavar='<project_id>',
-                                       required=True,
-                                       help="The ID of the Polarion project to search in.")
-
-    required_subarguments.add_argument('-q',
-                                       '--query',
-                                       type=str,
-                                       metavar='<query>',
-                                       required=True,
-                                       help="The query string to search for work items.")
-
-    sub_parser_search.add_argument('-o',
-                                   '--output',
-                                   type=str,
-                                   metavar='<output_folder>',
-                                   required=False,
-                                   help="The path to output folder to store the search results.")
+    add_project_argument(required_subarguments, "The ID of the Polarion project to search in.")
+    add_query_argument(required_subarguments, "The query string to search for work items.")
+
+    add_output_argument(sub_parser_search, "The path to output folder to store the search results.")
 
     sub_parser_search.add_argument('--full',
                                    action='store_true',
@@ -219,6 +264,32 @@ def register(subparser) -> dict:
                                    help="The field to search for in the work items. " +
                                    "Can be used multiple times to search for multiple fields.")
 
+    sub_parser_search.add_argument("--plan",
+                                   "--dry-run",
+                                   dest="plan",
+                                   action="store_true",
+                                   required=False,
+                                   help="Print the estimated costs of the search strategies " +
+                                   "without executing the search.")
+
+    sub_parser_search.add_argument("--auto",
+                                   action="store_true",
+                                   required=False,
+                                   help="Select the cheapest strategy which provides " +
+                                   "the requested fields and print the plan.")
+
+    add_jobs_argument(sub_parser_search, _DEFAULT_JOBS,
+                      "The number of work items to fetch concurrently by the concurrent strategy.")
+
+    sub_parser_search.add_argument("--cost-file",
+                                   type=str,
+                                   metavar="<cost_file>",
+                                   required=False,
+                                   help="The path to the file with the measured search costs. " +
+                                   "The costs of a search are only measured with --auto " +
+                                   "or this option. " +
+                                   f"Default: {_COST_FILE_NAME} in the output folder.")
+
     return cmd_dict
 
 
@@ -235,56 +306,53 @@ def _execute(args, polarion_client: Polarion) -> Ret:
     """
     ret_status: Ret = Ret.ERROR_INVALID_ARGUMENTS
 
-    if ("" != args.project) and ("" != args.query) and (None is not polarion_client):
-        output_folder: str = "."
+    if ("" != args.project) and ("" != args.query) and (0 < args.jobs) and \
+            (None is not polarion_client):
         output_dict: dict = {
             "project": args.project,
             "query": args.query,
             "number_of_results": 0,
             "results": [],
         }
-
-        if args.output is not None:
-            output_folder = args.output
-
-            if not os.path.isdir(output_folder):
-                os.mkdir(output_folder)
         file_path: str = os.path.join(
-            output_folder, f"{output_dict['project']}_{_OUTPUT_FILE_NAME}")
+            get_output_folder(args.output), f"{output_dict['project']}_{_OUTPUT_FILE_NAME}")
+        planner: Optional[SearchPlanner] = _get_planner(args, os.path.dirname(file_path))
 
         try:
             # Get the project object from the Polarion client.
             project: Project = polarion_client.getProject(
                 output_dict['project'])
 
-            if args.full is True:
-                # Search for work items in the project.
-                search_result: list[Workitem] = project.searchWorkitemFullItem(
-                    output_dict["query"])
+            strategy: str = _get_requested_strategy(args)
+            id_result: Optional[list] = None
+            id_seconds: float = 0.0
 
-                output_dict["results"] = \
-                    _parse_nested_search_results(search_result)
-            elif args.field is not None:
-                search_result: list[Workitem] = project.searchWorkitem(
-                    args.query, field_list=args.field)
+            if (args.plan is True) or (args.auto is True):
+                strategy, id_result, id_seconds = _plan(planner, project, args)
+
+            if args.plan is True:
+                ret_status = Ret.OK
 
-                output_dict["results"] = \
-                    _parse_nested_search_results(search_result)
             else:
-                search_result: list[Workitem] = project.searchWorkitem(
-                    args.query)
-                for item in search_result:
-                    item_dict = vars(item).get("__values__")
-                    output_dict["results"].append(item_dict)
+                start_time = time.perf_counter()
+                output_dict["results"] = _search(project, args, strategy, id_result)
+
+                # The search for the IDs is charged to the executed strategy, even if the
+                # projection doesn't reuse them, since it had to be done for the plan.
+                seconds = time.perf_counter() - start_time + id_seconds
+
+                output_dict["number_of_results"] = len(output_dict["results"])
+                output_json = json.dumps(output_dict, indent=2)
 
-            output_dict["number_of_results"] = len(output_dict["results"])
+                # Store the search results in a JSON file.
+                with open(file_path, 'w', encoding="UTF-8") as file:
+                    file.write(output_json)
 
-            # Store the search results in a JSON file.
-            with open(file_path, 'w', encoding="UTF-8") as file:
-                file.write(json.dumps(output_dict, indent=2))
+                LOG.info("Search results stored in %s", file_path)
+                ret_status = Ret.OK
 
-            LOG.info("Search results stored in %s", file_path)
-            ret_status = Ret.OK
+                if planner is not None:
+                    _measure(planner, args, strategy, output_dict, (seconds, len(output_json)))
 
         # Exception of type Exception is raised when the project does not exist.
         except Exception as ex:  # pylint: disable=broad-except
@@ -0,0 +1,273 @@
+"""Snapshot command module of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import logging
+import os
+from datetime import date
+import toml
+from polarion.polarion import Polarion
+from polarion.project import Project
+from pyPolarionCli.ret import Ret
+from pyPolarionCli.common import add_database_argument
+from pyPolarionCli.metrics_store import MetricsStore
+from pyPolarionCli.workitem_fields import get_field_value
+
+################################################################################
+# Variables
+################################################################################
+
+LOG: logging.Logger = logging.getLogger(__name__)
+_CMD_NAME = "snapshot"
+_BATCH_SIZE = 100
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _load_metrics(file_path: str) -> list[dict]:
+    """
+    Load the metric definitions from the configuration file.
+
+    Args:
+        file_path (str): The path to the TOML configuration file.
+
+    Returns:
+        list[dict]: The metric definitions with name, project, query and group_by.
+    """
+    metrics: list[dict] = []
+
+    for metric in toml.load(file_path).get("metrics", []):
+        for key in ["name", "project", "query"]:
+            if key not in metric:
+                raise ValueError(f"Metric is missing the key '{key}': {metric}")
+
+        metrics.append({
+            "name": metric["name"],
+            "project": metric["project"],
+            "query": metric["query"],
+            "group_by": metric.get("group_by", [])
+        })
+
+    return metrics
+
+
+def _get_groups(project: Project, workitem_ids: list[str], group_by: list[str]) -> dict:
+    """
+    Get the group of each work item. The work items are fetched in batches.
+
+    Args:
+        project (obj): The project object to search in.
+        workitem_ids (list[str]): The IDs of the work items.
+        group_by (list[str]): The fields to group by.
+
+    Returns:
+        dict: The group of each work item, with the work item ID as key.
+    """
+    groups: dict = {}
+
+    for index in range(0, len(workitem_ids), _BATCH_SIZE):
+        batch = workitem_ids[index:index + _BATCH_SIZE]
+        search_result = project.searchWorkitem(
+            f"id:({' '.join(batch)})", field_list=["id"] + group_by)
+
+        for workitem in search_result:
+            groups[workitem.id] = {field: get_field_value(workitem, field) for field in group_by}
+
+    return groups
+
+
+def _take_snapshot(polarion_client: Polarion, store: MetricsStore, metric: dict, day: str) -> None:
+    """
+    Take the snapshot of a metric. Only the work items which are new or
+    changed since the last snapshot are fetched with their group-by fields.
+
+    Args:
+        polarion_client (obj): The Polarion client object.
+        store (obj): The metrics store.
+        metric (dict): The metric definition.
+        day (str): The day of the snapshot in ISO format (YYYY-MM-DD).
+
+    Returns:
+        None
+    """
+    name = metric["name"]
+
+    if store.set_definition(name, metric) is True:
+        LOG.info("Definition of metric '%s' changed, recomputing all work items.", name)
+
+    project: Project = polarion_client.getProject(metric["project"])
+    search_result = project.searchWorkitem(metric["query"], field_list=["id", "updated"])
+
+    current_items: dict = {workitem.id: get_field_value(workitem, "updated")
+                           for workitem in search_result}
+    known_items: dict = store.get_items(name)
+
+    changed_ids = [workitem_id for workitem_id, updated in current_items.items()
+                   if known_items.get(workitem_id) != updated]
+    removed_ids = [workitem_id for workitem_id in known_items if workitem_id not in current_items]
+
+    groups: dict = {}
+    if (0 < len(changed_ids)) and (0 < len(metric["group_by"])):
+        groups = _get_groups(project, changed_ids, metric["group_by"])
+
+    store.update_items(name,
+                       [(workitem_id, current_items[workitem_id], groups.get(workitem_id, {}))
+                        for workitem_id in changed_ids],
+                       removed_ids)
+
+    number_of_groups = store.store_snapshot(name, day)
+
+    LOG.info("Metric '%s': %d work items, %d changed, %d removed, %d groups.",
+             name, len(current_items), len(changed_ids), len(removed_ids), number_of_groups)
+
+
+def _is_day_valid(store: MetricsStore, metrics: list[dict], day: str) -> bool:
+    """
+    Check that the day is not earlier than the latest snapshot of any metric.
+    The database only holds the current state of the work items, so a snapshot
+    of a past day would replace the real counts of that day with the current ones.
+
+    Args:
+        store (obj): The metrics store.
+        metrics (list[dict]): The metric definitions.
+        day (str): The day of the snapshot in ISO format (YYYY-MM-DD).
+
+    Returns:
+        bool: True if the snapshot can be taken, otherwise False.
+    """
+    is_valid = True
+
+    for metric in metrics:
+        latest_day = store.get_latest_day(metric["name"])
+
+        if (latest_day is not None) and (day < latest_day):
+            LOG.error("Snapshot of metric '%s' on %s is earlier than the latest snapshot on %s!",
+                      metric["name"], day, latest_day)
+            is_valid = False
+
+    return is_valid
+
+
+def register(subparser) -> dict:
+    """ Register subparser commands for the snapshot module.
+
+    Args:
+        subparser (obj):   the command subparser provided via __main__.py
+
+    Returns:
+        obj:    the command parser of this module
+    """
+    cmd_dict: dict = {
+        "name": _CMD_NAME,
+        "handler": _execute
+    }
+
+    sub_parser_snapshot: argparse.ArgumentParser = \
+        subparser.add_parser(_CMD_NAME,
+                             help="Store a daily snapshot of the configured metrics.")
+    required_subarguments = sub_parser_snapshot.add_argument_group(
+        'required arguments')
+
+    required_subarguments.add_argument('-c',
+                                       '--config',
+                                       type=str,
+                                       metavar='<config_file>',
+                                       required=True,
+                                       help="The path to the TOML file with the metric " +
+                                       "definitions.")
+
+    add_database_argument(sub_parser_snapshot)
+
+    sub_parser_snapshot.add_argument('--date',
+                                     type=date.fromisoformat,
+                                     metavar='<YYYY-MM-DD>',
+                                     default=None,
+                                     required=False,
+                                     help="The day of the snapshot. Default: today. " +
+                                     "Must not be earlier than the latest snapshot, since " +
+                                     "the database only holds the current state of the work items.")
+
+    return cmd_dict
+
+
+def _execute(args, polarion_client: Polarion) -> Ret:
+    """ This function serves as entry point for the command 'snapshot'.
+        It will be stored as callback for this module's subparser command.
+
+    Args:
+        args (obj): The command line arguments.
+        polarion_client (obj): The Polarion client object.
+
+    Returns:
+        bool: The status of the command execution.
+    """
+    ret_status: Ret = Ret.ERROR_INVALID_ARGUMENTS
+
+    if os.path.isfile(args.config) and (None is not polarion_client):
+        day: str = date.today().isoformat()
+
+        if args.date is not None:
+            day = args.date.isoformat()
+
+        try:
+            metrics = _load_metrics(args.config)
+
+            with MetricsStore(args.database) as store:
+                if _is_day_valid(store, metrics, day) is True:
+                    for metric in metrics:
+                        _take_snapshot(polarion_client, store, metric, day)
+
+                    LOG.info("Snapshot of %d metrics stored in %s", len(metrics), args.database)
+                    ret_status = Ret.OK
+
+        # Exception of type Exception is raised when the project does not exist.
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.error("%s", ex)
+            ret_status = Ret.ERROR_SNAPSHOT_FAILED
+
+    else:
+        LOG.error("Configuration file '%s' not found!", args.config)
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,277 @@
+"""Testruns command module of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import argparse
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TextIO
+from polarion.polarion import Polarion
+from polarion.project import Project
+from pyPolarionCli.ret import Ret
+from pyPolarionCli.serializer import parse_nested_search_results
+from pyPolarionCli.common import add_project_argument, add_query_argument, add_output_argument, \
+    add_jobs_argument, get_output_folder
+
+################################################################################
+# Variables
+################################################################################
+
+LOG: logging.Logger = logging.getLogger(__name__)
+_CMD_NAME = "testruns"
+_OUTPUT_FILE_NAME = "testruns"
+_FORMATS = ["json", "jsonl"]
+_DEFAULT_JOBS = 4
+
+################################################################################
+# Classes
+################################################################################
+
+
+class _RecordWriter:
+    """Streams the test records into the output file, so they don't have
+    to be kept in memory until all test runs are fetched.
+
+    "json" writes a single document in the layout of the search command,
+    "jsonl" writes one test record per line.
+    """
+
+    def __init__(self, file: TextIO, output_format: str, header: dict) -> None:
+        """
+        Args:
+            file (obj): The output file.
+            output_format (str): The output format, see _FORMATS.
+            header (dict): The information about the export, only written in the "json" format.
+        """
+        self._file = file
+        self._format = output_format
+        self._header = header
+        self._is_first_record = True
+        self.number_of_test_runs = 0
+        self.number_of_results = 0
+
+    def write_header(self) -> None:
+        """
+        Write the start of the output.
+        """
+        if "json" == self._format:
+            self._file.write("{\n")
+            for key, value in self._header.items():
+                self._file.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+            self._file.write('  "results": [')
+
+    def write_record(self, record: dict) -> None:
+        """
+        Write a parsed test record.
+
+        Args:
+            record (dict): The parsed test record.
+        """
+        if "json" == self._format:
+            separator = "\n    " if self._is_first_record else ",\n    "
+            self._file.write(separator + json.dumps(record))
+        else:
+            self._file.write(json.dumps(record) + "\n")
+
+        self._is_first_record = False
+        self.number_of_results += 1
+
+    def write_footer(self) -> None:
+        """
+        Write the end of the output.
+        """
+        if "json" == self._format:
+            if self._is_first_record is False:
+                self._file.write("\n  ")
+            self._file.write("],\n")
+            self._file.write(f'  "number_of_test_runs": {self.number_of_test_runs},\n')
+            self._file.write(f'  "number_of_results": {self.number_of_results}\n')
+            self._file.write("}\n")
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _get_test_run(service: object, test_run_uri: str) -> object:
+    """
+    Get a test run including its test records.
+
+    Args:
+        service (obj): The TestManagement service of the Polarion client.
+        test_run_uri (str): The URI of the test run.
+
+    Returns:
+        obj: The test run as returned by the Polarion server.
+    """
+    test_run = service.getTestRunByUri(test_run_uri)
+
+    if (test_run is None) or (test_run.unresolvable is True):
+        raise RuntimeError(f"Cannot find test run {test_run_uri}")
+
+    return test_run
+
+
+def _write_test_run(writer: _RecordWriter, test_run: object) -> None:
+    """
+    Parse the test records of a test run one by one and write them.
+
+    Args:
+        writer (obj): The writer of the output file.
+        test_run (obj): The test run as returned by the Polarion server.
+
+    Returns:
+        None
+    """
+    records: list = []
+
+    if test_run.records is not None:
+        records = test_run.records.TestRecord
+
+    for record in records:
+        record_dict = parse_nested_search_results([record])[0]
+        record_dict["testRunId"] = test_run.id
+        writer.write_record(record_dict)
+
+    writer.number_of_test_runs += 1
+
+
+def register(subparser) -> dict:
+    """ Register subparser commands for the testruns module.
+
+    Args:
+        subparser (obj):   the command subparser provided via __main__.py
+
+    Returns:
+        obj:    the command parser of this module
+    """
+    cmd_dict: dict = {
+        "name": _CMD_NAME,
+        "handler": _execute
+    }
+
+    sub_parser_testruns: argparse.ArgumentParser = \
+        subparser.add_parser(_CMD_NAME,
+                             help="Export the test records of Polarion test runs.")
+    required_subarguments = sub_parser_testruns.add_argument_group(
+        'required arguments')
+
+    add_project_argument(required_subarguments, "The ID of the Polarion project to search in.")
+    add_query_argument(required_subarguments, "The query string to search for test runs.")
+    add_output_argument(sub_parser_testruns, "The path to output folder to store the test records.")
+
+    sub_parser_testruns.add_argument('--format',
+                                     type=str,
+                                     choices=_FORMATS,
+                                     default=_FORMATS[0],
+                                     required=False,
+                                     help="The output format. Default: json.")
+
+    add_jobs_argument(sub_parser_testruns, _DEFAULT_JOBS,
+                      "The number of test runs to fetch concurrently.")
+
+    return cmd_dict
+
+
+def _execute(args, polarion_client: Polarion) -> Ret:
+    """ This function serves as entry point for the command 'testruns'.
+        It will be stored as callback for this module's subparser command.
+
+    Args:
+        args (obj): The command line arguments.
+        polarion_client (obj): The Polarion client object.
+
+    Returns:
+        bool: The status of the command execution.
+    """
+    ret_status: Ret = Ret.ERROR_INVALID_ARGUMENTS
+
+    if ("" != args.project) and ("" != args.query) and (0 < args.jobs) and \
+            (None is not polarion_client):
+        header: dict = {
+            "project": args.project,
+            "query": args.query
+        }
+        file_path: str = os.path.join(get_output_folder(args.output),
+                                      f"{args.project}_{_OUTPUT_FILE_NAME}.{args.format}")
+
+        try:
+            # Get the project object from the Polarion client.
+            project: Project = polarion_client.getProject(args.project)
+
+            # Each getService() call checks the session with an additional request,
+            # therefore the service is fetched once and shared by all jobs.
+            service = polarion_client.getService('TestManagement')
+
+            # Only the URIs are required to select the test runs,
+            # the records are fetched per test run.
+            test_runs = service.searchTestRunsWithFieldsLimited(
+                f"({args.query}) AND project.id:{project.id}", "id", ["id"], -1)
+
+            with open(file_path, 'w', encoding="UTF-8") as file, \
+                    ThreadPoolExecutor(max_workers=args.jobs) as executor:
+                writer = _RecordWriter(file, args.format, header)
+                writer.write_header()
+
+                # Keep at most one test run per job in memory,
+                # the results are written in query order.
+                pending: deque = deque()
+                for test_run in test_runs:
+                    if len(pending) >= args.jobs:
+                        _write_test_run(writer, pending.popleft().result())
+
+                    pending.append(executor.submit(_get_test_run, service, test_run.uri))
+
+                while 0 < len(pending):
+                    _write_test_run(writer, pending.popleft().result())
+
+                writer.write_footer()
+
+            LOG.info("%d test records of %d test runs stored in %s",
+                     writer.number_of_results, writer.number_of_test_runs, file_path)
+            ret_status = Ret.OK
+
+        # Exception of type Exception is raised when the project does not exist.
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.error("%s", ex)
+            ret_status = Ret.ERROR_TESTRUNS_FAILED
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,162 @@
+"""Trend command module of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import argparse
+import logging
+import os
+from datetime import date
+from pyPolarionCli.ret import Ret
+from pyPolarionCli.common import add_database_argument, add_output_argument, get_output_folder
+from pyPolarionCli.metrics_store import MetricsStore
+
+################################################################################
+# Variables
+################################################################################
+
+LOG: logging.Logger = logging.getLogger(__name__)
+_CMD_NAME = "trend"
+_OUTPUT_FILE_NAME = "trend.json"
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def register(subparser) -> dict:
+    """ Register subparser commands for the trend module.
+
+    Args:
+        subparser (obj):   the command subparser provided via __main__.py
+
+    Returns:
+        obj:    the command parser of this module
+    """
+    cmd_dict: dict = {
+        "name": _CMD_NAME,
+        "handler": _execute,
+        "client": False
+    }
+
+    sub_parser_trend: argparse.ArgumentParser = \
+        subparser.add_parser(_CMD_NAME,
+                             help="Get the trend of a metric from the metrics database. " +
+                             "Does not access the Polarion server.")
+    required_subarguments = sub_parser_trend.add_argument_group(
+        'required arguments')
+
+    required_subarguments.add_argument('-m',
+                                       '--metric',
+                                       type=str,
+                                       metavar='<metric>',
+                                       required=True,
+                                       help="The name of the metric.")
+
+    add_database_argument(sub_parser_trend)
+
+    sub_parser_trend.add_argument('--from',
+                                  dest="start_date",
+                                  type=date.fromisoformat,
+                                  metavar='<YYYY-MM-DD>',
+                                  default=None,
+                                  required=False,
+                                  help="The first day of the trend.")
+
+    sub_parser_trend.add_argument('--to',
+                                  dest="end_date",
+                                  type=date.fromisoformat,
+                                  metavar='<YYYY-MM-DD>',
+                                  default=None,
+                                  required=False,
+                                  help="The last day of the trend.")
+
+    add_output_argument(sub_parser_trend, "The path to output folder to store the trend.")
+
+    return cmd_dict
+
+
+def _execute(args, _polarion_client) -> Ret:
+    """ This function serves as entry point for the command 'trend'.
+        It will be stored as callback for this module's subparser command.
+
+    Args:
+        args (obj): The command line arguments.
+        _polarion_client (obj): Not used, the trend is read from the metrics database only.
+
+    Returns:
+        bool: The status of the command execution.
+    """
+    ret_status: Ret = Ret.ERROR_INVALID_ARGUMENTS
+
+    if ("" != args.metric) and os.path.isfile(args.database):
+        output_dict: dict = {
+            "metric": args.metric,
+            "from": None if args.start_date is None else args.start_date.isoformat(),
+            "to": None if args.end_date is None else args.end_date.isoformat(),
+            "series": []
+        }
+
+        output_folder: str = get_output_folder(args.output)
+        file_path: str = os.path.join(
+            output_folder, f"{output_dict['metric']}_{_OUTPUT_FILE_NAME}")
+
+        try:
+            with MetricsStore(args.database) as store:
+                output_dict["series"] = store.get_trend(
+                    output_dict["metric"], output_dict["from"], output_dict["to"])
+
+            # Store the trend in a JSON file.
+            with open(file_path, 'w', encoding="UTF-8") as file:
+                file.write(json.dumps(output_dict, indent=2))
+
+            LOG.info("Trend stored in %s", file_path)
+            ret_status = Ret.OK
+
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.error("%s", ex)
+            ret_status = Ret.ERROR_TREND_FAILED
+
+    else:
+        LOG.error("Metrics database '%s' not found!", args.database)
+
+    return ret_status
+
+################################################################################
+# Main
+################################################################################
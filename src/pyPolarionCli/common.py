@@ -0,0 +1,174 @@
+"""Common helpers of the command modules of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import argparse
+import os
+from typing import Optional
+
+################################################################################
+# Variables
+################################################################################
+
+_DATABASE_FILE_NAME = "metrics.db"
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def add_project_argument(group, help_text: str) -> None:
+    """
+    Add the argument for the Polarion project ID.
+
+    Args:
+        group (obj): The argument group of the required arguments of the command.
+        help_text (str): The help text of the argument.
+
+    Returns:
+        None
+    """
+    group.add_argument('-j',
+                       '--project',
+                       type=str,
+                       metavar='<project_id>',
+                       required=True,
+                       help=help_text)
+
+
+def add_query_argument(group, help_text: str) -> None:
+    """
+    Add the argument for the Polarion query.
+
+    Args:
+        group (obj): The argument group of the required arguments of the command.
+        help_text (str): The help text of the argument.
+
+    Returns:
+        None
+    """
+    group.add_argument('-q',
+                       '--query',
+                       type=str,
+                       metavar='<query>',
+                       required=True,
+                       help=help_text)
+
+
+def add_output_argument(parser: argparse.ArgumentParser, help_text: str) -> None:
+    """
+    Add the optional argument for the output folder.
+
+    Args:
+        parser (obj): The parser of the command.
+        help_text (str): The help text of the argument.
+
+    Returns:
+        None
+    """
+    parser.add_argument('-o',
+                        '--output',
+                        type=str,
+                        metavar='<output_folder>',
+                        required=False,
+                        help=help_text)
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser, default: int, help_text: str) -> None:
+    """
+    Add the optional argument for the number of concurrent requests.
+
+    Args:
+        parser (obj): The parser of the command.
+        default (int): The default number of concurrent requests.
+        help_text (str): The help text of the argument, the default is appended.
+
+    Returns:
+        None
+    """
+    parser.add_argument("--jobs",
+                        type=int,
+                        metavar="<jobs>",
+                        default=default,
+                        required=False,
+                        help=f"{help_text} Default: {default}.")
+
+
+def add_database_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the optional argument for the metrics database.
+
+    Args:
+        parser (obj): The parser of the command.
+
+    Returns:
+        None
+    """
+    parser.add_argument('-d',
+                        '--database',
+                        type=str,
+                        metavar='<database_file>',
+                        default=_DATABASE_FILE_NAME,
+                        required=False,
+                        help=f"The path to the metrics database. Default: {_DATABASE_FILE_NAME}.")
+
+
+def get_output_folder(output: Optional[str]) -> str:
+    """
+    Get the output folder and create it if it doesn't exist yet.
+
+    Args:
+        output (str): The output folder given by the command line arguments,
+            None for the current folder.
+
+    Returns:
+        str: The path to the output folder.
+    """
+    output_folder: str = "."
+
+    if output is not None:
+        output_folder = output
+
+        if not os.path.isdir(output_folder):
+            os.mkdir(output_folder)
+
+    return output_folder
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,255 @@
+"""Time-series database of the metric snapshots of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import sqlite3
+from typing import Optional
+
+################################################################################
+# Variables
+################################################################################
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    name TEXT PRIMARY KEY,
+    definition TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    metric TEXT NOT NULL,
+    id TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    group_key TEXT NOT NULL,
+    PRIMARY KEY (metric, id)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    metric TEXT NOT NULL,
+    day TEXT NOT NULL,
+    group_key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (metric, day, group_key)
+);
+"""
+
+################################################################################
+# Classes
+################################################################################
+
+
+class MetricsStore:
+    """Local time-series database of the aggregated metric counts.
+
+    The table "items" holds the last known state of every work item matched by a metric,
+    so a new snapshot only has to update the work items which changed.
+    The table "snapshots" holds the aggregated counts per metric, day and group.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Open the database and create the tables if they don't exist yet.
+
+        Args:
+            file_path (str): The path to the SQLite database file.
+        """
+        self._connection = sqlite3.connect(file_path)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        self._connection.close()
+
+    def set_definition(self, metric: str, definition: dict) -> bool:
+        """
+        Store the definition of a metric. If the definition changed since the
+        last snapshot, the known work items of the metric are discarded.
+
+        Args:
+            metric (str): The name of the metric.
+            definition (dict): The definition of the metric, e.g. query and group-by fields.
+
+        Returns:
+            bool: True if the definition changed, otherwise False.
+        """
+        definition_str = json.dumps(definition, sort_keys=True)
+        row = self._connection.execute(
+            "SELECT definition FROM metrics WHERE name = ?", (metric,)).fetchone()
+        is_changed = (row is None) or (row[0] != definition_str)
+
+        if is_changed is True:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO metrics (name, definition) VALUES (?, ?)",
+                    (metric, definition_str))
+                self._connection.execute(
+                    "DELETE FROM items WHERE metric = ?", (metric,))
+
+        return is_changed
+
+    def get_items(self, metric: str) -> dict:
+        """
+        Get the known work items of a metric.
+
+        Args:
+            metric (str): The name of the metric.
+
+        Returns:
+            dict: The last update timestamp of each work item, with the work item ID as key.
+        """
+        rows = self._connection.execute(
+            "SELECT id, updated FROM items WHERE metric = ?", (metric,))
+        return dict(rows.fetchall())
+
+    def update_items(self, metric: str, changed_items: list[tuple], removed_ids: list[str]) -> None:
+        """
+        Update the known work items of a metric.
+
+        Args:
+            metric (str): The name of the metric.
+            changed_items (list[tuple]): The new or changed work items
+                as (ID, updated, group) tuples.
+            removed_ids (list[str]): The IDs of the work items which don't match
+                the metric anymore.
+
+        Returns:
+            None
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO items (metric, id, updated, group_key) VALUES (?, ?, ?, ?)",
+                [(metric, workitem_id, updated, json.dumps(group, sort_keys=True))
+                 for workitem_id, updated, group in changed_items])
+            self._connection.executemany(
+                "DELETE FROM items WHERE metric = ? AND id = ?",
+                [(metric, workitem_id) for workitem_id in removed_ids])
+
+    def store_snapshot(self, metric: str, day: str) -> int:
+        """
+        Aggregate the known work items of a metric and store the counts as snapshot of the day.
+        An existing snapshot of the same day is replaced. Groups of earlier snapshots which
+        have no work items anymore get an explicit count of 0, so the day doesn't look like
+        a missing snapshot. The same applies if no work item matches the metric at all.
+
+        Args:
+            metric (str): The name of the metric.
+            day (str): The day of the snapshot in ISO format (YYYY-MM-DD).
+
+        Returns:
+            int: The number of groups with matching work items.
+        """
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM snapshots WHERE metric = ? AND day = ?", (metric, day))
+            cursor = self._connection.execute(
+                "INSERT INTO snapshots (metric, day, group_key, count) "
+                "SELECT metric, ?, group_key, COUNT(*) FROM items "
+                "WHERE metric = ? GROUP BY group_key",
+                (day, metric))
+            number_of_groups = cursor.rowcount
+
+            # The empty group only marks a snapshot without any work item, see below.
+            cursor = self._connection.execute(
+                "INSERT INTO snapshots (metric, day, group_key, count) "
+                "SELECT DISTINCT metric, ?, group_key, 0 FROM snapshots "
+                "WHERE metric = ? AND day < ? AND group_key != ? AND group_key NOT IN "
+                "(SELECT group_key FROM items WHERE metric = ?)",
+                (day, metric, day, json.dumps({}), metric))
+
+            if (0 == number_of_groups) and (0 == cursor.rowcount):
+                self._connection.execute(
+                    "INSERT INTO snapshots (metric, day, group_key, count) VALUES (?, ?, ?, 0)",
+                    (metric, day, json.dumps({})))
+
+        return number_of_groups
+
+    def get_latest_day(self, metric: str) -> Optional[str]:
+        """
+        Get the day of the latest snapshot of a metric.
+
+        Args:
+            metric (str): The name of the metric.
+
+        Returns:
+            str: The day in ISO format (YYYY-MM-DD), None if there is no snapshot yet.
+        """
+        row = self._connection.execute(
+            "SELECT MAX(day) FROM snapshots WHERE metric = ?", (metric,)).fetchone()
+
+        return row[0]
+
+    def get_trend(self,
+                  metric: str,
+                  start_day: Optional[str] = None,
+                  end_day: Optional[str] = None) -> list[dict]:
+        """
+        Get the series of the aggregated counts of a metric.
+
+        Args:
+            metric (str): The name of the metric.
+            start_day (str): The first day of the series in ISO format (YYYY-MM-DD). Optional.
+            end_day (str): The last day of the series in ISO format (YYYY-MM-DD). Optional.
+
+        Returns:
+            list[dict]: The counts per day and group, ordered by day.
+        """
+        query = "SELECT day, group_key, count FROM snapshots WHERE metric = ?"
+        parameters: list = [metric]
+
+        if start_day is not None:
+            query += " AND day >= ?"
+            parameters.append(start_day)
+
+        if end_day is not None:
+            query += " AND day <= ?"
+            parameters.append(end_day)
+
+        query += " ORDER BY day, group_key"
+
+        return [{"day": day, "group": json.loads(group_key), "count": count}
+                for day, group_key, count in self._connection.execute(query, parameters)]
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
@@ -50,6 +50,11 @@ class Ret(IntEnum):
     ERROR_ARGPARSE = 2  # Must be 2 to match the argparse error code.
     ERROR_INVALID_ARGUMENTS = 3
     ERROR_SEARCH_FAILED = 4
+    ERROR_HISTORY_FAILED = 5
+    ERROR_SNAPSHOT_FAILED = 6
+    ERROR_TREND_FAILED = 7
+    ERROR_TESTRUNS_FAILED = 8
+    ERROR_DOCUMENT_FAILED = 9
 
 ################################################################################
 # Functions
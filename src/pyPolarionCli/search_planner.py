@@ -0,0 +1,260 @@
+"""Cost-based planner of the search strategies of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import json
+import logging
+import os
+
+################################################################################
+# Variables
+################################################################################
+
+LOG: logging.Logger = logging.getLogger(__name__)
+
+STRATEGY_DEFAULT = "default"
+STRATEGY_PROJECTION = "projection"
+STRATEGY_FULL = "full"
+STRATEGY_CONCURRENT = "concurrent"
+
+# Which strategies provide which kind of requested fields, ordered by preference on equal cost.
+_SATISFYING_STRATEGIES = {
+    STRATEGY_DEFAULT: [STRATEGY_DEFAULT, STRATEGY_PROJECTION, STRATEGY_CONCURRENT, STRATEGY_FULL],
+    STRATEGY_PROJECTION: [STRATEGY_PROJECTION, STRATEGY_CONCURRENT, STRATEGY_FULL],
+    STRATEGY_FULL: [STRATEGY_CONCURRENT, STRATEGY_FULL]
+}
+
+# Costs used until they are measured. The full and concurrent strategies share
+# their per item costs, since both fetch every work item with its own request.
+# The output size is the size of the stored results, not the size of the server
+# responses. The output size of the projection is given per item and requested field.
+_DEFAULT_COSTS = {
+    "seconds_per_request": 0.3,
+    STRATEGY_DEFAULT: {"seconds_per_item": 0.001, "bytes_per_item": 50},
+    STRATEGY_PROJECTION: {"seconds_per_item": 0.002, "bytes_per_item": 150},
+    STRATEGY_FULL: {"seconds_per_item": 0.15, "bytes_per_item": 4000}
+}
+
+# Every search of the Polarion library checks the session with an additional request.
+_REQUESTS_PER_SEARCH = 2
+
+# Weight of a new measurement in the moving average of the costs.
+_MEASUREMENT_WEIGHT = 0.5
+
+################################################################################
+# Classes
+################################################################################
+
+
+class SearchPlanner:
+    """Estimates the costs of the search strategies from the measured per item costs
+    and selects the cheapest strategy which provides the requested fields.
+
+    The measured costs are stored in a JSON file, so they improve with every search.
+    """
+
+    def __init__(self, cost_file_path: str) -> None:
+        """
+        Load the measured costs. Missing costs are taken from the defaults.
+
+        Args:
+            cost_file_path (str): The path to the JSON file with the measured costs.
+        """
+        self._cost_file_path = cost_file_path
+        self._costs: dict = json.loads(json.dumps(_DEFAULT_COSTS))
+
+        if os.path.isfile(cost_file_path):
+            try:
+                with open(cost_file_path, 'r', encoding="UTF-8") as file:
+                    measured_costs: dict = json.load(file)
+
+                for key, value in measured_costs.items():
+                    if isinstance(self._costs.get(key), dict):
+                        self._costs[key].update(value)
+                    elif key in self._costs:
+                        self._costs[key] = value
+
+            except (OSError, ValueError, TypeError) as ex:
+                LOG.warning("Ignoring invalid cost file %s: %s", cost_file_path, ex)
+
+    @staticmethod
+    def _get_cost_key(strategy: str) -> str:
+        """
+        Get the key of the per item costs of a strategy.
+        """
+        return STRATEGY_FULL if STRATEGY_CONCURRENT == strategy else strategy
+
+    def estimate(self, number_of_items: int, number_of_fields: int, jobs: int) -> list[dict]:
+        """
+        Estimate the costs of all strategies.
+
+        Args:
+            number_of_items (int): The number of work items matched by the query.
+            number_of_fields (int): The number of requested fields of the projection.
+            jobs (int): The number of concurrent requests of the concurrent strategy.
+
+        Returns:
+            list[dict]: The estimated requests, output size in bytes and duration in seconds
+                per strategy.
+        """
+        plans: list[dict] = []
+        seconds_per_request = self._costs["seconds_per_request"]
+
+        for strategy in [STRATEGY_DEFAULT, STRATEGY_PROJECTION, STRATEGY_FULL, STRATEGY_CONCURRENT]:
+            item_costs = self._costs[self._get_cost_key(strategy)]
+            bytes_per_item = item_costs["bytes_per_item"]
+            seconds = number_of_items * item_costs["seconds_per_item"]
+
+            if STRATEGY_PROJECTION == strategy:
+                bytes_per_item *= max(number_of_fields, 1)
+
+            # The full strategies need the IDs of the work items first. Then the session
+            # is checked once for the shared service, which fetches each work item.
+            if strategy in [STRATEGY_FULL, STRATEGY_CONCURRENT]:
+                requests = _REQUESTS_PER_SEARCH + 1 + number_of_items
+            else:
+                requests = _REQUESTS_PER_SEARCH
+
+            if STRATEGY_CONCURRENT == strategy:
+                seconds /= max(jobs, 1)
+
+            plans.append({
+                "strategy": strategy,
+                "requests": requests,
+                "bytes": int(number_of_items * bytes_per_item),
+                "seconds": seconds_per_request + seconds
+            })
+
+        return plans
+
+    @staticmethod
+    def choose(plans: list[dict], requested: str) -> dict:
+        """
+        Choose the cheapest strategy which provides the requested fields.
+
+        Args:
+            plans (list[dict]): The estimated costs per strategy, see estimate().
+            requested (str): The strategy which provides the requested fields,
+                i.e. default for IDs only, projection for selected fields and full for all fields.
+
+        Returns:
+            dict: The plan of the chosen strategy.
+        """
+        satisfying = _SATISFYING_STRATEGIES[requested]
+        candidates = [plan for plan in plans if plan["strategy"] in satisfying]
+
+        return min(candidates,
+                   key=lambda plan: (plan["seconds"], satisfying.index(plan["strategy"])))
+
+    @staticmethod
+    def format_plans(plans: list[dict], chosen: dict, requested: str) -> str:
+        """
+        Format the estimated costs as table.
+
+        Args:
+            plans (list[dict]): The estimated costs per strategy, see estimate().
+            chosen (dict): The plan of the chosen strategy.
+            requested (str): The strategy which provides the requested fields.
+
+        Returns:
+            str: The table.
+        """
+        lines = [f"{'Strategy':<12}{'Requests':>10}{'Output size':>14}{'Duration':>12}"]
+
+        for plan in plans:
+            note = ""
+            if plan is chosen:
+                note = "  <- chosen"
+            elif plan["strategy"] not in _SATISFYING_STRATEGIES[requested]:
+                note = "  (misses requested fields)"
+
+            lines.append(f"{plan['strategy']:<12}{plan['requests']:>10}"
+                         f"{plan['bytes'] / 1024:>11.1f} KB{plan['seconds']:>10.1f} s{note}")
+
+        return "\n".join(lines)
+
+    # pylint: disable=too-many-arguments
+    def measure(self,
+                strategy: str,
+                number_of_items: int,
+                number_of_fields: int,
+                *,
+                seconds: float,
+                size: int,
+                jobs: int) -> None:
+        """
+        Update the per item costs of a strategy with a measurement.
+
+        Args:
+            strategy (str): The executed strategy.
+            number_of_items (int): The number of fetched work items.
+            number_of_fields (int): The number of requested fields of the projection.
+            seconds (float): The duration of the search in seconds.
+            size (int): The size of the stored results in bytes.
+            jobs (int): The number of concurrent requests of the concurrent strategy.
+
+        Returns:
+            None
+        """
+        if 0 < number_of_items:
+            item_costs = self._costs[self._get_cost_key(strategy)]
+            seconds_per_item = \
+                max(seconds - self._costs["seconds_per_request"], 0) / number_of_items
+            bytes_per_item = size / number_of_items
+
+            if STRATEGY_PROJECTION == strategy:
+                bytes_per_item /= max(number_of_fields, 1)
+
+            if STRATEGY_CONCURRENT == strategy:
+                seconds_per_item *= max(jobs, 1)
+
+            for key, value in [("seconds_per_item", seconds_per_item),
+                               ("bytes_per_item", bytes_per_item)]:
+                item_costs[key] = (1 - _MEASUREMENT_WEIGHT) * item_costs[key] + \
+                    _MEASUREMENT_WEIGHT * value
+
+    def save(self) -> None:
+        """
+        Store the measured costs.
+        """
+        with open(self._cost_file_path, 'w', encoding="UTF-8") as file:
+            file.write(json.dumps(self._costs, indent=2))
+
+################################################################################
+# Functions
+################################################################################
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,155 @@
+"""Serializer of Polarion objects of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+from datetime import date, datetime
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _handle_object_with_dict(obj_with_dict: object) -> dict:
+    """
+    Handle an object with a __dict__ attribute.
+
+    Args:
+        obj_with_dict (obj): The object to handle.
+
+    Returns:
+        dict: The dictionary representation of the object.
+    """
+    parsed_dict: dict = {}
+    for _, subvalue in obj_with_dict.__dict__.items():
+        for subkey in subvalue:
+            _parse_attributes_recursively(
+                parsed_dict,
+                subvalue[subkey],
+                subkey)
+    return parsed_dict
+
+
+def _parse_attributes_recursively(output_dict: dict, value: object, key: str) -> None:
+    """
+    Parse the attributes of Python objects recursively and store them in a dictionary.
+
+    Args:
+        output_dict (dict): The dictionary to store the parsed attributes.
+        value (obj): The value to parse.
+        key (str): The key of the value in the dictionary.
+
+    Returns:
+        None
+    """
+    attribute_value = None
+
+    # Check if the value is a datetime or date object
+    if isinstance(value, (datetime, date)):
+        attribute_value = value.isoformat()
+
+    # Check if the value is a list
+    elif isinstance(value, list):
+        sublist: list = []
+        for element in value:
+            # Check if the element is an object with a __dict__ attribute
+            if hasattr(element, "__dict__"):
+                sublist.append(_handle_object_with_dict(element))
+
+            # Check if the element is a list
+            elif isinstance(element, list):
+                raise RuntimeWarning("List in List")
+
+            # element is a simple value
+            else:
+                sublist.append(element)
+
+        # Store the list in the attribute value
+        attribute_value = sublist
+
+    # Check if the value is an object with a __dict__ attribute
+    elif hasattr(value, "__dict__"):
+        attribute_value = _handle_object_with_dict(value)
+
+    # value is a simple value
+    else:
+        attribute_value = value
+
+    # Store the attribute value in the output dictionary
+    output_dict[key] = attribute_value
+
+
+def parse_nested_search_results(search_result: list) -> list[dict]:
+    """Parse the attributes of the search results recursively into dictionaries.
+
+    Args:
+        search_result (list): The work items or other Polarion objects, e.g. test records.
+
+    Returns:
+        list[dict]: The list of parsed objects.
+    """
+    output_list: list[dict] = []
+
+    # Iterate over the search results and store them in the output dictionary.
+    for workitem in search_result:
+        workitem_dict: dict = {}
+
+        # Parse the attributes of the work item recursively.
+        # Internal _polarion_item attribute is used to access the work item attributes.
+        # pylint: disable=protected-access
+        if hasattr(workitem, "_polarion_item"):
+            all_items = workitem._polarion_item.__dict__.items()
+        else:
+            all_items = workitem.__dict__.items()
+
+        for _, value in all_items:
+            for key in value:
+                _parse_attributes_recursively(
+                    workitem_dict, value[key], key)
+
+        # Append the work item dictionary to the results list.
+        output_list.append(workitem_dict)
+
+    return output_list
+
+################################################################################
+# Main
+################################################################################
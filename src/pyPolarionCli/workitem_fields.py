@@ -0,0 +1,119 @@
+"""Conversion of Polarion work item fields into compact values of the pyPolarionCli"""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2024 - 2026, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICU5LAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+from datetime import date, datetime
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def value_to_str(value: object) -> str:
+    """
+    Convert a field value of a work item into a compact string.
+
+    Args:
+        value (obj): The field value as returned by the Polarion server.
+
+    Returns:
+        str: The string representation of the value.
+    """
+    value_str: str = ""
+
+    if value is None:
+        value_str = ""
+
+    # Check if the value is a datetime or date object
+    elif isinstance(value, (datetime, date)):
+        value_str = value.isoformat()
+
+    # Check if the value is a list, e.g. a multi-enum field
+    elif isinstance(value, list):
+        value_str = ";".join(value_to_str(element) for element in value)
+
+    # Enumerations and users are referenced by their ID.
+    elif hasattr(value, "id"):
+        value_str = str(value.id)
+
+    # Text fields hold their value in the content.
+    elif hasattr(value, "content"):
+        value_str = str(value.content)
+
+    # value is a simple value
+    else:
+        value_str = str(value)
+
+    return value_str
+
+
+def get_field_value(workitem: object, field: str) -> str:
+    """
+    Get the value of a field of a work item.
+    Custom fields are referenced by "customFields.<key>".
+
+    Args:
+        workitem (obj): The work item as returned by the Polarion server.
+        field (str): The name of the field.
+
+    Returns:
+        str: The string representation of the field value.
+    """
+    value: object = None
+
+    if field.startswith("customFields."):
+        key = field[len("customFields."):]
+        custom_fields = getattr(workitem, "customFields", None)
+
+        if custom_fields is not None:
+            for custom_field in custom_fields.Custom:
+                if custom_field.key == key:
+                    value = custom_field.value
+                    break
+    else:
+        value = getattr(workitem, field, None)
+
+    return value_to_str(value)
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,128 @@
+"""Tests of the document command module.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyPolarionCli.cmd_document import _DocumentReader, _get_fields, _get_structured_workitems, \
+    _split_workitem_uri
+
+
+def _get_uri(project_id: str, workitem_id: str) -> str:
+    return f"subterra:data-service:objects:/default/{project_id}${{WorkItem}}{workitem_id}"
+
+
+def _get_workitem(workitem_id: str, workitem_type: str, outline_number: str) -> dict:
+    return {
+        "id": workitem_id,
+        "title": f"Title {workitem_id}",
+        "type": {"id": workitem_type},
+        "outlineNumber": outline_number
+    }
+
+
+def test_split_workitem_uri():
+    """The project ID and the work item ID are taken from the URI.
+    """
+    assert ("MYPROJECT", "MYPROJECT-123") == _split_workitem_uri(_get_uri("MYPROJECT",
+                                                                         "MYPROJECT-123"))
+    assert ("OTHER", "OTHER-1") == _split_workitem_uri(_get_uri("OTHER", "OTHER-1"))
+
+
+def test_get_fields():
+    """Additional fields are fetched besides the default fields.
+    """
+    assert ["id", "title", "type", "outlineNumber", "status"] == _get_fields(None)
+    assert ["id", "title", "type", "outlineNumber", "status", "description"] == \
+        _get_fields(["description", "status", "id"])
+
+
+def test_structured_workitems():
+    """The work items are sorted by outline number and get their enclosing headings.
+    """
+    cache = {
+        "h1": _get_workitem("P-1", "heading", "1"),
+        "r1": _get_workitem("P-2", "requirement", "1-1"),
+        "h11": _get_workitem("P-3", "heading", "1.1"),
+        "r11": _get_workitem("P-4", "requirement", "1.1-1"),
+        "r12": _get_workitem("P-5", "requirement", "1.1-2"),
+        "r10": _get_workitem("P-6", "requirement", "1.1-10"),
+        "h2": _get_workitem("P-7", "heading", "2"),
+        "h10": _get_workitem("P-8", "heading", "10")
+    }
+
+    # The URIs of the document are not in structural order, one is deleted.
+    workitems = _get_structured_workitems(
+        ["h10", "r10", "r12", "h2", "deleted", "r11", "h11", "r1", "h1"], cache)
+
+    assert ["1", "1-1", "1.1", "1.1-1", "1.1-2", "1.1-10", "2", "10"] == \
+        [workitem["outlineNumber"] for workitem in workitems]
+    assert [[], ["Title P-1"], ["Title P-1"], ["Title P-1", "Title P-3"]] == \
+        [workitem["headings"] for workitem in workitems[:4]]
+    assert [1, 2, 1, 1] == [workitem["level"] for workitem in workitems
+                            if "heading" == workitem["type"]["id"]]
+    assert [] == workitems[-1]["headings"]
+
+    # The cached work items are not modified.
+    assert "headings" not in cache["h1"]
+
+
+def test_structured_workitems_without_outline_number():
+    """Work items without a valid outline number are placed last in their given order.
+    """
+    cache = {
+        "a": _get_workitem("P-1", "requirement", ""),
+        "b": _get_workitem("P-2", "requirement", "2-1"),
+        "c": _get_workitem("P-3", "requirement", "x")
+    }
+
+    assert ["P-2", "P-1", "P-3"] == \
+        [workitem["id"] for workitem in _get_structured_workitems(["a", "b", "c"], cache)]
+
+
+class _Workitem:  # pylint: disable=too-few-public-methods
+    """Work item stub which stores its values in __values__ like zeep objects.
+    """
+
+    def __init__(self, values: dict):
+        self.__values__ = values
+
+    def __getattr__(self, name):
+        if name not in self.__values__:
+            raise AttributeError(name)
+        return self.__values__[name]
+
+
+class _TrackerService:
+    """Tracker service stub which returns the requested work items.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def queryWorkItemsLimited(self, query, _sort, _fields, _limit):  # pylint: disable=invalid-name
+        """Query the work items of a project by their IDs."""
+        self.queries.append(query)
+        project_id = query.split()[0].split(":")[1]
+        workitem_ids = query.split("id:(")[1].rstrip(")").split()
+
+        return [_Workitem({"id": workitem_id, "uri": _get_uri(project_id, workitem_id)})
+                for workitem_id in workitem_ids]
+
+
+def test_workitems_are_fetched_once():
+    """Work items are fetched in batches per project and only once.
+    """
+    service = _TrackerService()
+    uris = [_get_uri("P", "P-1"), _get_uri("P", "P-2"), _get_uri("Q", "Q-1")]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reader = _DocumentReader(service, executor, ["id"], 2)
+
+        workitems = reader.fetch(uris)
+        assert {uri: {"id": uri.split("}")[1], "uri": uri} for uri in uris} == workitems
+        assert ["project.id:P AND id:(P-1 P-2)", "project.id:Q AND id:(Q-1)"] == \
+            service.queries
+
+        service.queries.clear()
+        reader.fetch(uris + [_get_uri("P", "P-3")])
+        assert ["project.id:P AND id:(P-3)"] == service.queries
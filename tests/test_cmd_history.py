@@ -0,0 +1,95 @@
+"""Tests of the history command module.
+"""
+
+from types import SimpleNamespace
+
+from pyPolarionCli.cmd_history import _get_field_changes, _get_workitem_revisions
+
+
+class _TrackerService:
+    """Tracker service stub with three revisions of one work item.
+    """
+
+    VALUES = {
+        "1": {"status": "open", "severity": "major"},
+        "2": {"status": "open", "severity": "minor"},
+        "3": {"status": "done", "severity": "minor"}
+    }
+
+    def __init__(self):
+        self.requests = []
+
+    def getRevisions(self, _uri):  # pylint: disable=invalid-name
+        """Get the revisions of the work item."""
+        return list(self.VALUES)
+
+    def getWorkItemByUriInRevision(self, _uri, revision, fields):  # pylint: disable=invalid-name
+        """Get the work item in a revision with the given fields."""
+        self.requests.append((revision, sorted(fields)))
+        workitem = {"updated": f"2025-01-0{revision}"}
+
+        for field in fields:
+            if field in self.VALUES[revision]:
+                workitem[field] = SimpleNamespace(id=self.VALUES[revision][field])
+
+        return SimpleNamespace(**workitem)
+
+
+def test_get_field_changes():
+    """Only the initial value and changed values result in a row.
+    """
+    revisions = [
+        {"revision": "1", "updated": "t1", "fields": {"status": "open", "severity": "major"}},
+        {"revision": "2", "updated": "t2", "fields": {"status": "open", "severity": "minor"}},
+        {"revision": "3", "updated": "t3", "fields": {"status": "done", "severity": "minor"}}
+    ]
+
+    assert _get_field_changes("P-1", revisions, ["status", "severity"]) == [
+        ["P-1", "1", "t1", "status", "", "open"],
+        ["P-1", "1", "t1", "severity", "", "major"],
+        ["P-1", "2", "t2", "severity", "major", "minor"],
+        ["P-1", "3", "t3", "status", "open", "done"]
+    ]
+
+
+def test_get_field_changes_without_revisions():
+    """A work item without revisions has no changes.
+    """
+    assert not _get_field_changes("P-1", [], ["status"])
+
+
+def test_revisions_are_cached(tmp_path):
+    """A second run doesn't fetch any revision again.
+    """
+    service = _TrackerService()
+    workitem = SimpleNamespace(id="P-1", uri="uri")
+
+    first = _get_workitem_revisions(service, workitem, ["status"], str(tmp_path))
+    assert 3 == len(service.requests)
+
+    second = _get_workitem_revisions(service, workitem, ["status"], str(tmp_path))
+    assert 3 == len(service.requests)
+    assert first == second
+    assert ["open", "open", "done"] == [revision["fields"]["status"] for revision in second]
+
+
+def test_cache_keeps_union_of_fields(tmp_path):
+    """Adding a field fetches only that field, alternating field sets don't fetch again.
+    """
+    service = _TrackerService()
+    workitem = SimpleNamespace(id="P-1", uri="uri")
+
+    _get_workitem_revisions(service, workitem, ["status"], str(tmp_path))
+    service.requests.clear()
+
+    revisions = _get_workitem_revisions(service, workitem,
+                                        ["status", "severity"], str(tmp_path))
+    assert [("1", ["severity", "updated"]),
+            ("2", ["severity", "updated"]),
+            ("3", ["severity", "updated"])] == service.requests
+    assert {"status": "done", "severity": "minor"} == revisions[2]["fields"]
+    service.requests.clear()
+
+    _get_workitem_revisions(service, workitem, ["status"], str(tmp_path))
+    _get_workitem_revisions(service, workitem, ["severity"], str(tmp_path))
+    assert not service.requests
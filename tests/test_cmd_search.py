@@ -0,0 +1,60 @@
+"""Tests of the search command module.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pyPolarionCli.cmd_search import _get_planner, _search
+from pyPolarionCli.search_planner import STRATEGY_FULL, STRATEGY_CONCURRENT
+
+
+def _get_args(**kwargs) -> SimpleNamespace:
+    args = {"plan": False, "auto": False, "cost_file": None}
+    args.update(kwargs)
+    return SimpleNamespace(**args)
+
+
+def test_plain_search_has_no_planner(tmp_path):
+    """A plain search neither measures nor stores any costs.
+    """
+    assert _get_planner(_get_args(), str(tmp_path)) is None
+
+
+@pytest.mark.parametrize("args", [{"plan": True}, {"auto": True}, {"cost_file": "costs.json"}])
+def test_planner(tmp_path, args):
+    """The planner is used with --plan, --auto or an explicit cost file.
+    """
+    assert _get_planner(_get_args(**args), str(tmp_path)) is not None
+
+
+class _Workitem:  # pylint: disable=too-few-public-methods
+    """Work item stub which stores its values in __values__ like zeep objects.
+    """
+
+    def __init__(self, values: dict):
+        self.__values__ = values
+
+    def __getattr__(self, name):
+        if name not in self.__values__:
+            raise AttributeError(name)
+        return self.__values__[name]
+
+
+@pytest.mark.parametrize("strategy", [STRATEGY_FULL, STRATEGY_CONCURRENT])
+def test_full_search_shares_service(strategy):
+    """The full work items are fetched with one service, which is requested only once.
+    """
+    service_names = []
+    service = SimpleNamespace(
+        getWorkItemById=lambda project_id, workitem_id: _Workitem({"id": workitem_id,
+                                                                    "title": project_id}))
+    polarion_client = SimpleNamespace(
+        getService=lambda name: service_names.append(name) or service)
+    project = SimpleNamespace(id="P", polarion=polarion_client)
+    id_result = [SimpleNamespace(id=f"P-{index}") for index in range(10)]
+
+    results = _search(project, SimpleNamespace(jobs=4), strategy, id_result)
+
+    assert ["Tracker"] == service_names
+    assert [{"id": f"P-{index}", "title": "P"} for index in range(10)] == results
@@ -0,0 +1,65 @@
+"""Tests of the snapshot command module.
+"""
+
+from types import SimpleNamespace
+
+from pyPolarionCli.cmd_snapshot import _is_day_valid, _take_snapshot
+from pyPolarionCli.metrics_store import MetricsStore
+
+
+class _Project:
+    """Project stub which returns the given work items.
+    """
+
+    def __init__(self, workitems: dict):
+        self.workitems = workitems
+        self.queries = []
+
+    def searchWorkitem(self, query, field_list):  # pylint: disable=invalid-name
+        """Search for work items, either all or a list of IDs."""
+        self.queries.append((query, field_list))
+        ids = list(self.workitems)
+
+        if query.startswith("id:("):
+            ids = query[len("id:("):-1].split()
+
+        return [SimpleNamespace(id=workitem_id,
+                                updated=self.workitems[workitem_id][0],
+                                severity=SimpleNamespace(id=self.workitems[workitem_id][1]))
+                for workitem_id in ids]
+
+
+_METRIC = {"name": "bugs", "project": "P", "query": "type:defect", "group_by": ["severity"]}
+
+
+def test_snapshot_fetches_only_changed_items(tmp_path):
+    """The group-by fields are only fetched for new or changed work items.
+    """
+    project = _Project({"P-1": ("t1", "major"), "P-2": ("t1", "minor")})
+    client = SimpleNamespace(getProject=lambda _id: project)
+
+    with MetricsStore(str(tmp_path / "metrics.db")) as store:
+        _take_snapshot(client, store, _METRIC, "2025-01-01")
+        assert ("id:(P-1 P-2)", ["id", "severity"]) == project.queries[-1]
+
+        project.queries.clear()
+        project.workitems = {"P-2": ("t2", "major"), "P-3": ("t1", "minor")}
+        _take_snapshot(client, store, _METRIC, "2025-01-02")
+        assert [("type:defect", ["id", "updated"]),
+                ("id:(P-2 P-3)", ["id", "severity"])] == project.queries
+
+        assert [{"day": "2025-01-02", "group": {"severity": "major"}, "count": 1},
+                {"day": "2025-01-02", "group": {"severity": "minor"}, "count": 1}] == \
+            store.get_trend("bugs", start_day="2025-01-02")
+
+
+def test_day_earlier_than_latest_snapshot_is_refused(tmp_path):
+    """A snapshot must not be taken for a day before the latest snapshot.
+    """
+    with MetricsStore(str(tmp_path / "metrics.db")) as store:
+        assert _is_day_valid(store, [_METRIC], "2025-01-01") is True
+        store.store_snapshot("bugs", "2025-01-02")
+
+        assert _is_day_valid(store, [_METRIC], "2025-01-01") is False
+        assert _is_day_valid(store, [_METRIC], "2025-01-02") is True
+        assert _is_day_valid(store, [_METRIC], "2025-01-03") is True
@@ -0,0 +1,77 @@
+"""Tests of the testruns command module.
+"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pyPolarionCli.cmd_testruns import _RecordWriter, _get_test_run, _write_test_run
+
+_HEADER = {"project": "P", "query": "status:finished"}
+
+
+def _create_test_run(test_run_id: str, results: list[str]) -> SimpleNamespace:
+    # Like zeep objects, the records store their values in __values__.
+    records = [SimpleNamespace(__values__={"result": result}) for result in results]
+    return SimpleNamespace(id=test_run_id, records=SimpleNamespace(TestRecord=records))
+
+
+def _write(output_format: str, test_runs: list) -> str:
+    file = io.StringIO()
+    writer = _RecordWriter(file, output_format, _HEADER)
+    writer.write_header()
+
+    for test_run in test_runs:
+        _write_test_run(writer, test_run)
+
+    writer.write_footer()
+    return file.getvalue()
+
+
+@pytest.mark.parametrize("test_runs", [[], [SimpleNamespace(id="TR-1", records=None)]])
+def test_json_without_records(test_runs):
+    """The JSON output is valid without any test record.
+    """
+    output = json.loads(_write("json", test_runs))
+
+    assert "P" == output["project"]
+    assert [] == output["results"]
+    assert len(test_runs) == output["number_of_test_runs"]
+    assert 0 == output["number_of_results"]
+
+
+def test_json_with_records():
+    """The JSON output contains all records with the ID of their test run.
+    """
+    output = json.loads(_write("json", [_create_test_run("TR-1", ["passed", "failed"]),
+                                        _create_test_run("TR-2", ["blocked"])]))
+
+    assert 2 == output["number_of_test_runs"]
+    assert 3 == output["number_of_results"]
+    assert [("TR-1", "passed"), ("TR-1", "failed"), ("TR-2", "blocked")] == \
+        [(record["testRunId"], record["result"]) for record in output["results"]]
+
+
+def test_jsonl():
+    """The JSON lines output contains one valid JSON object per record and nothing else.
+    """
+    assert "" == _write("jsonl", [])
+
+    lines = _write("jsonl", [_create_test_run("TR-1", ["passed", "failed"])]).splitlines()
+    assert ["passed", "failed"] == [json.loads(line)["result"] for line in lines]
+
+
+def test_get_test_run():
+    """The test run is fetched with the given service, unresolvable test runs are an error.
+    """
+    test_runs = {"uri-1": SimpleNamespace(id="TR-1", unresolvable=False),
+                 "uri-2": SimpleNamespace(id="TR-2", unresolvable=True)}
+    service = SimpleNamespace(getTestRunByUri=test_runs.get)
+
+    assert "TR-1" == _get_test_run(service, "uri-1").id
+
+    for uri in ["uri-2", "uri-3"]:
+        with pytest.raises(RuntimeError):
+            _get_test_run(service, uri)
@@ -0,0 +1,39 @@
+"""Tests of the login argument checks of the main module.
+"""
+
+import sys
+
+import pytest
+
+from pyPolarionCli.__main__ import main
+from pyPolarionCli.ret import Ret
+
+
+def test_missing_user_is_argparse_error(monkeypatch):
+    """A command which accesses the server requires user and server like argparse does.
+    """
+    monkeypatch.setattr(sys, "argv", ["pyPolarionCli", "-p", "pw", "search", "-j", "P", "-q", "q"])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert Ret.ERROR_ARGPARSE == exit_info.value.code
+
+
+def test_missing_password_and_token(monkeypatch):
+    """A command which accesses the server requires a password or a token.
+    """
+    monkeypatch.setattr(sys, "argv", ["pyPolarionCli", "-u", "user", "-s", "server",
+                                      "search", "-j", "P", "-q", "q"])
+
+    assert Ret.ERROR_INVALID_ARGUMENTS == main()
+
+
+def test_trend_needs_no_login(monkeypatch, tmp_path):
+    """The trend command works without any login arguments.
+    """
+    monkeypatch.setattr(sys, "argv", ["pyPolarionCli", "trend", "-m", "bugs",
+                                      "-d", str(tmp_path / "missing.db")])
+
+    # Fails only because the database doesn't exist, not because of the login.
+    assert Ret.ERROR_INVALID_ARGUMENTS == main()
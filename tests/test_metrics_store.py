@@ -0,0 +1,104 @@
+"""Tests of the metrics store.
+"""
+
+from pyPolarionCli.metrics_store import MetricsStore
+
+
+def _get_store(tmp_path) -> MetricsStore:
+    return MetricsStore(str(tmp_path / "metrics.db"))
+
+
+def test_snapshot_and_trend(tmp_path):
+    """The snapshots count the known work items per group and day.
+    """
+    with _get_store(tmp_path) as store:
+        store.set_definition("bugs", {"query": "type:defect"})
+        store.update_items("bugs",
+                           [("P-1", "t1", {"severity": "major"}),
+                            ("P-2", "t1", {"severity": "minor"}),
+                            ("P-3", "t1", {"severity": "minor"})],
+                           [])
+        assert 2 == store.store_snapshot("bugs", "2025-01-01")
+
+        store.update_items("bugs", [("P-1", "t2", {"severity": "minor"})], ["P-3"])
+        assert 1 == store.store_snapshot("bugs", "2025-01-02")
+
+        assert [
+            {"day": "2025-01-01", "group": {"severity": "major"}, "count": 1},
+            {"day": "2025-01-01", "group": {"severity": "minor"}, "count": 2},
+            {"day": "2025-01-02", "group": {"severity": "major"}, "count": 0},
+            {"day": "2025-01-02", "group": {"severity": "minor"}, "count": 2}
+        ] == store.get_trend("bugs")
+
+        assert [{"day": "2025-01-02", "group": {"severity": "major"}, "count": 0},
+                {"day": "2025-01-02", "group": {"severity": "minor"}, "count": 2}] == \
+            store.get_trend("bugs", start_day="2025-01-02")
+        assert 2 == len(store.get_trend("bugs", end_day="2025-01-01"))
+        assert "2025-01-02" == store.get_latest_day("bugs")
+
+
+def test_snapshot_of_same_day_is_replaced(tmp_path):
+    """Taking the snapshot of a day again replaces its counts.
+    """
+    with _get_store(tmp_path) as store:
+        store.update_items("bugs", [("P-1", "t1", {})], [])
+        store.store_snapshot("bugs", "2025-01-01")
+        store.update_items("bugs", [("P-2", "t1", {})], [])
+        store.store_snapshot("bugs", "2025-01-01")
+
+        assert [{"day": "2025-01-01", "group": {}, "count": 2}] == store.get_trend("bugs")
+
+
+def test_snapshot_without_items_stores_zero(tmp_path):
+    """A day without matching work items has an explicit count of 0.
+    """
+    with _get_store(tmp_path) as store:
+        assert 0 == store.store_snapshot("bugs", "2025-01-01")
+        assert [{"day": "2025-01-01", "group": {}, "count": 0}] == store.get_trend("bugs")
+
+        store.update_items("bugs", [("P-1", "t1", {"severity": "major"})], [])
+        store.store_snapshot("bugs", "2025-01-02")
+        store.update_items("bugs", [], ["P-1"])
+        assert 0 == store.store_snapshot("bugs", "2025-01-03")
+
+        # The groups of earlier snapshots drop to 0, the empty group is not continued.
+        assert [{"day": "2025-01-02", "group": {"severity": "major"}, "count": 1},
+                {"day": "2025-01-03", "group": {"severity": "major"}, "count": 0}] == \
+            store.get_trend("bugs", start_day="2025-01-02")
+
+
+def test_group_of_later_snapshot_is_not_continued(tmp_path):
+    """Only groups of earlier snapshots get a count of 0.
+    """
+    with _get_store(tmp_path) as store:
+        store.update_items("bugs", [("P-1", "t1", {"severity": "major"})], [])
+        store.store_snapshot("bugs", "2025-01-01")
+        store.update_items("bugs", [("P-1", "t2", {"severity": "minor"})], [])
+        store.store_snapshot("bugs", "2025-01-02")
+
+        # Taking the first snapshot again doesn't add the group of the second one.
+        store.store_snapshot("bugs", "2025-01-01")
+
+        assert [{"day": "2025-01-01", "group": {"severity": "minor"}, "count": 1}] == \
+            store.get_trend("bugs", end_day="2025-01-01")
+
+
+def test_changed_definition_discards_items(tmp_path):
+    """The known work items are discarded if the definition of a metric changes.
+    """
+    with _get_store(tmp_path) as store:
+        assert store.set_definition("bugs", {"query": "type:defect"}) is True
+        store.update_items("bugs", [("P-1", "t1", {})], [])
+
+        assert store.set_definition("bugs", {"query": "type:defect"}) is False
+        assert {"P-1": "t1"} == store.get_items("bugs")
+
+        assert store.set_definition("bugs", {"query": "type:bug"}) is True
+        assert {} == store.get_items("bugs")
+
+
+def test_latest_day_without_snapshot(tmp_path):
+    """A metric without snapshot has no latest day.
+    """
+    with _get_store(tmp_path) as store:
+        assert store.get_latest_day("bugs") is None
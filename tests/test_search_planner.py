@@ -0,0 +1,102 @@
+"""Tests of the search planner.
+"""
+
+import json
+
+import pytest
+
+from pyPolarionCli.search_planner import SearchPlanner, STRATEGY_DEFAULT, STRATEGY_PROJECTION, \
+    STRATEGY_FULL, STRATEGY_CONCURRENT
+
+_COSTS = {
+    "seconds_per_request": 1.0,
+    STRATEGY_DEFAULT: {"seconds_per_item": 0.01, "bytes_per_item": 10},
+    STRATEGY_PROJECTION: {"seconds_per_item": 0.02, "bytes_per_item": 20},
+    STRATEGY_FULL: {"seconds_per_item": 1.0, "bytes_per_item": 1000}
+}
+
+
+def _get_planner(tmp_path) -> SearchPlanner:
+    cost_file_path = tmp_path / "search_costs.json"
+    cost_file_path.write_text(json.dumps(_COSTS), encoding="UTF-8")
+    return SearchPlanner(str(cost_file_path))
+
+
+def _get_plan(plans: list[dict], strategy: str) -> dict:
+    return next(plan for plan in plans if strategy == plan["strategy"])
+
+
+def test_estimate(tmp_path):
+    """The estimate is based on the costs per item and request.
+    """
+    plans = _get_planner(tmp_path).estimate(100, 3, 4)
+
+    assert [STRATEGY_DEFAULT, STRATEGY_PROJECTION, STRATEGY_FULL, STRATEGY_CONCURRENT] == \
+        [plan["strategy"] for plan in plans]
+    assert {"strategy": STRATEGY_DEFAULT, "requests": 2, "bytes": 1000,
+            "seconds": pytest.approx(2.0)} == plans[0]
+    assert {"strategy": STRATEGY_PROJECTION, "requests": 2, "bytes": 6000,
+            "seconds": pytest.approx(3.0)} == plans[1]
+    assert {"strategy": STRATEGY_FULL, "requests": 103, "bytes": 100000,
+            "seconds": pytest.approx(101.0)} == plans[2]
+    assert {"strategy": STRATEGY_CONCURRENT, "requests": 103, "bytes": 100000,
+            "seconds": pytest.approx(26.0)} == plans[3]
+
+
+def test_choose(tmp_path):
+    """The cheapest strategy which provides the requested fields is chosen.
+    """
+    planner = _get_planner(tmp_path)
+    plans = planner.estimate(100, 3, 4)
+
+    assert STRATEGY_DEFAULT == planner.choose(plans, STRATEGY_DEFAULT)["strategy"]
+    assert STRATEGY_PROJECTION == planner.choose(plans, STRATEGY_PROJECTION)["strategy"]
+    assert STRATEGY_CONCURRENT == planner.choose(plans, STRATEGY_FULL)["strategy"]
+
+    # On equal costs the order of preference applies.
+    assert STRATEGY_CONCURRENT == planner.choose(planner.estimate(100, 3, 1),
+                                                 STRATEGY_FULL)["strategy"]
+
+
+def test_measure_and_save(tmp_path):
+    """A measurement moves the costs halfway towards the measured costs and is stored.
+    """
+    planner = _get_planner(tmp_path)
+    planner.measure(STRATEGY_PROJECTION, 100, 2, seconds=4.0, size=8000, jobs=4)
+    planner.measure(STRATEGY_CONCURRENT, 10, 0, seconds=2.0, size=5000, jobs=4)
+    planner.save()
+
+    plans = SearchPlanner(str(tmp_path / "search_costs.json")).estimate(100, 2, 4)
+    assert planner.estimate(100, 2, 4) == plans
+
+    # Projection: (0.02 + 0.03) / 2 seconds and (20 + 40) / 2 bytes per item and field.
+    projection = _get_plan(plans, STRATEGY_PROJECTION)
+    assert pytest.approx(1.0 + 100 * 0.025) == projection["seconds"]
+    assert 100 * 30 * 2 == projection["bytes"]
+
+    # Concurrent: The full strategy shares the measured costs without the concurrency.
+    full = _get_plan(plans, STRATEGY_FULL)
+    assert pytest.approx(1.0 + 100 * 0.7) == full["seconds"]
+    assert 100 * 750 == full["bytes"]
+
+
+def test_measure_without_items(tmp_path):
+    """A search without results doesn't change the costs.
+    """
+    planner = _get_planner(tmp_path)
+    plans = planner.estimate(100, 3, 4)
+
+    planner.measure(STRATEGY_DEFAULT, 0, 0, seconds=10.0, size=100, jobs=4)
+
+    assert plans == planner.estimate(100, 3, 4)
+
+
+def test_invalid_cost_file(tmp_path):
+    """An invalid cost file is ignored.
+    """
+    cost_file_path = tmp_path / "search_costs.json"
+    cost_file_path.write_text("invalid", encoding="UTF-8")
+
+    plans = SearchPlanner(str(cost_file_path)).estimate(10, 1, 1)
+
+    assert 4 == len(plans)